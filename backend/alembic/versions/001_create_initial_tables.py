@@ -47,11 +47,6 @@ def upgrade() -> None:
         sa.Column('repo_path', sa.String(500), nullable=True),
     )
 
-    # Create indexes
-    op.create_index('ix_submissions_candidate_email', 'submissions', ['candidate_email'])
-    op.create_index('ix_submissions_task_id', 'submissions', ['task_id'])
-    op.create_index('ix_submissions_status', 'submissions', ['status'])
-
     # Create tasks table
     op.create_table(
         'tasks',
@@ -66,6 +61,12 @@ def upgrade() -> None:
         sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
     )
 
+    # Create indexes without locking writes (CONCURRENTLY can't run in a transaction)
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_submissions_candidate_email ON submissions (candidate_email)")
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_submissions_task_id ON submissions (task_id)")
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_submissions_status ON submissions (status)")
+
 
 def downgrade() -> None:
     op.drop_table('tasks')
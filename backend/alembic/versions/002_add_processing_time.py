@@ -8,7 +8,6 @@ Create Date: 2026-02-19
 from typing import Sequence, Union
 
 from alembic import op
-import sqlalchemy as sa
 
 # revision identifiers, used by Alembic.
 revision: str = '002'
@@ -18,10 +17,11 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    # Add processing_time_ms column to submissions table
-    op.add_column(
-        'submissions',
-        sa.Column('processing_time_ms', sa.Integer, nullable=True)
+    # Add processing_time_ms column to submissions table.
+    # IF NOT EXISTS covers databases where init_db() already created it,
+    # without any catalog introspection round-trips.
+    op.execute(
+        "ALTER TABLE submissions ADD COLUMN IF NOT EXISTS processing_time_ms INTEGER"
     )
 
 
@@ -0,0 +1,39 @@
+"""convert json columns to jsonb
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '004'
+down_revision: Union[str, None] = '003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+JSON_COLUMNS = {
+    'submissions': [
+        'scores', 'flags', 'strengths', 'weaknesses', 'screenshots', 'analysis_details',
+    ],
+    'tasks': ['expected_structure', 'tech_requirements', 'scoring_criteria'],
+}
+
+
+def upgrade() -> None:
+    for table, columns in JSON_COLUMNS.items():
+        alterations = ", ".join(
+            f"ALTER COLUMN {column} TYPE jsonb USING {column}::jsonb" for column in columns
+        )
+        op.execute(f"ALTER TABLE {table} {alterations}")
+
+
+def downgrade() -> None:
+    for table, columns in JSON_COLUMNS.items():
+        alterations = ", ".join(
+            f"ALTER COLUMN {column} TYPE json USING {column}::json" for column in columns
+        )
+        op.execute(f"ALTER TABLE {table} {alterations}")
@@ -0,0 +1,49 @@
+"""move analysis_details into submission_analysis
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '005'
+down_revision: Union[str, None] = '004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keep the large analysis payload off the main submissions row
+    op.create_table(
+        'submission_analysis',
+        sa.Column(
+            'submission_id',
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey('submissions.id', ondelete='CASCADE'),
+            primary_key=True,
+        ),
+        sa.Column('details', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    )
+    op.execute(
+        "INSERT INTO submission_analysis (submission_id, details) "
+        "SELECT id, analysis_details FROM submissions WHERE analysis_details IS NOT NULL"
+    )
+    op.drop_column('submissions', 'analysis_details')
+
+
+def downgrade() -> None:
+    op.add_column(
+        'submissions',
+        sa.Column('analysis_details', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    )
+    op.execute(
+        "UPDATE submissions SET analysis_details = sa.details "
+        "FROM submission_analysis sa WHERE sa.submission_id = submissions.id"
+    )
+    op.drop_table('submission_analysis')
@@ -0,0 +1,33 @@
+"""add batch_id to submissions
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '007'
+down_revision: Union[str, None] = '006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE submissions ADD COLUMN IF NOT EXISTS batch_id VARCHAR(32)")
+
+    # Bulk status filters by batch and groups by status
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_submissions_batch_id_status "
+            "ON submissions (batch_id, status)"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_submissions_batch_id_status")
+    op.execute("ALTER TABLE submissions DROP COLUMN IF EXISTS batch_id")
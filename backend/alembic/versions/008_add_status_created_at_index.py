@@ -0,0 +1,33 @@
+"""replace status index with (status, created_at, id)
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '008'
+down_revision: Union[str, None] = '007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Serves WHERE status = ? ORDER BY created_at DESC, id DESC; the old
+    # single-column status index is a prefix of it
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_submissions_status_created_at_id "
+            "ON submissions (status, created_at, id)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_submissions_status")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_submissions_status ON submissions (status)")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_submissions_status_created_at_id")
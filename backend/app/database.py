@@ -3,7 +3,12 @@ Database Configuration
 SQLAlchemy async setup with PostgreSQL
 """
 
+import asyncio
 import logging
+import uuid
+from typing import Any, Dict, Iterable, Sequence
+
+import orjson
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
@@ -12,11 +17,43 @@ from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+
+def _json_serializer(value: Any) -> str:
+    """Serialize JSON/JSONB column values with orjson"""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _connect_args() -> Dict[str, Any]:
+    """asyncpg connect args tuned for short, repetitive OLTP queries"""
+    if settings.DB_PGBOUNCER:
+        # Transaction pooling can't keep per-connection prepared statements
+        # or accept startup settings; rely on SQLAlchemy's compiled cache.
+        return {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+        }
+    return {
+        # Reuse prepared statements (asyncpg and SQLAlchemy's adapter cache)
+        # and skip JIT for short OLTP queries
+        "statement_cache_size": 1024,
+        "prepared_statement_cache_size": 1024,
+        "server_settings": {"jit": "off"},
+    }
+
+
 # Create async engine
 engine = create_async_engine(
     settings.DATABASE_URL,
-    echo=settings.DEBUG,
+    echo=settings.SQL_ECHO,
     future=True,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_pre_ping=True,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
+    connect_args=_connect_args(),
 )
 
 # Create async session factory
@@ -27,11 +64,27 @@ async_session = async_sessionmaker(
 )
 
 
+# Startup migration state, reported by /health/migrations
+migration_status: Dict[str, Any] = {
+    "mode": settings.MIGRATION_MODE,
+    "state": "skipped" if settings.MIGRATION_MODE == "external" else "pending",
+    "error": None,
+}
+
+
 # Base class for models
 class Base(DeclarativeBase):
     """Base class for all SQLAlchemy models"""
 
-    pass
+    def _read_fields(self, fields: Iterable[str]) -> Dict[str, Any]:
+        """
+        Read loaded column values straight from the instance __dict__.
+
+        Skips the instrumented attribute descriptor per field; anything
+        not loaded yet falls back to normal attribute access.
+        """
+        state = self.__dict__
+        return {key: state[key] if key in state else getattr(self, key) for key in fields}
 
 
 # Dependency for getting database session
@@ -48,6 +101,27 @@ async def get_db() -> AsyncSession:
             await session.close()
 
 
+async def copy_records(
+    session: AsyncSession,
+    table: str,
+    columns: Sequence[str],
+    records: Iterable[tuple],
+) -> None:
+    """
+    Bulk load rows with Postgres COPY over the session's asyncpg connection.
+
+    COPY bypasses SQLAlchemy's lazily-started transaction, so it runs in its
+    own asyncpg transaction: either every row is loaded and committed when
+    this returns, or none is. A later session rollback does not undo it.
+    """
+    conn = await session.connection()
+    raw = await conn.get_raw_connection()
+    async with raw.driver_connection.transaction():
+        await raw.driver_connection.copy_records_to_table(
+            table, records=records, columns=list(columns)
+        )
+
+
 async def run_migrations():
     """Run database migrations for new columns"""
     migrations = [
@@ -56,9 +130,26 @@ async def run_migrations():
             "name": "add_processing_time_ms",
             "sql": "ALTER TABLE submissions ADD COLUMN IF NOT EXISTS processing_time_ms INTEGER",
         },
+        # Add batch_id column for bulk upload tracking
+        {
+            "name": "add_batch_id",
+            "sql": "ALTER TABLE submissions ADD COLUMN IF NOT EXISTS batch_id VARCHAR(32)",
+        },
     ]
 
     async with engine.begin() as conn:
+        # Send every DDL statement in one round-trip: without parameters
+        # asyncpg runs a multi-statement string as a single simple query
+        raw = await conn.get_raw_connection()
+        script = ";\n".join(migration["sql"] for migration in migrations)
+        try:
+            async with conn.begin_nested():
+                await raw.driver_connection.execute(script)
+            logger.info(f"Migrations applied: {', '.join(m['name'] for m in migrations)}")
+            return
+        except Exception as e:
+            logger.warning(f"Batched migrations failed, applying individually: {e}")
+
         for migration in migrations:
             try:
                 await conn.execute(text(migration["sql"]))
@@ -69,14 +160,46 @@ async def run_migrations():
 
 async def init_db():
     """Initialize database (create tables and run migrations)"""
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-
-    # Run migrations for new columns
-    await run_migrations()
+    migration_status["state"] = "running"
+    try:
+        if settings.is_development and settings.AUTO_CREATE_TABLES:
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+
+        # Run migrations for new columns
+        await run_migrations()
+    except Exception as e:
+        migration_status["state"] = "failed"
+        migration_status["error"] = str(e)
+        logger.error(f"Database initialization failed: {e}")
+        raise
+
+    migration_status["state"] = "completed"
     logger.info("Database initialization complete")
 
 
+def get_migration_status() -> Dict[str, Any]:
+    """Get the status of startup database initialization"""
+    return dict(migration_status)
+
+
+async def warm_pool(size: int) -> None:
+    """
+    Open `size` pooled connections up front so the first requests
+    skip the connect/auth handshake.
+    """
+    async def _touch():
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    results = await asyncio.gather(*(_touch() for _ in range(size)), return_exceptions=True)
+    failed = sum(1 for result in results if isinstance(result, Exception))
+    if failed:
+        logger.warning(f"Connection pool warm-up: {failed} of {size} connections failed")
+    else:
+        logger.info(f"Connection pool warmed with {size} connections")
+
+
 async def close_db():
     """Close database connections"""
     await engine.dispose()
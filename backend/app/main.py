@@ -3,14 +3,17 @@ InternAudit AI - FastAPI Application Entry Point
 """
 
 import uuid
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 
+import orjson
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import settings
-from app.database import init_db
+from app.database import close_db, get_migration_status, init_db, warm_pool
+from app.services.commit_analyzer import create_github_client
 from app.services.websocket_manager import get_websocket_manager
 
 # Configure logging
@@ -20,14 +23,43 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+_uuid4 = uuid.uuid4
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan events"""
     # Startup: Initialize database tables
-    await init_db()
+    migration_task = None
+    if settings.MIGRATION_MODE == "background":
+        # Serve requests while migrations run; progress is at /health/migrations
+        migration_task = asyncio.create_task(_init_db_in_background())
+    elif settings.MIGRATION_MODE != "external":
+        await init_db()
+
+    # Pre-open pooled connections without holding up startup
+    warm_task = None
+    if settings.DB_POOL_WARM > 0:
+        warm_task = asyncio.create_task(warm_pool(settings.DB_POOL_WARM))
+
+    # One GitHub client for all requests keeps connections alive
+    app.state.github_client = create_github_client()
     yield
     # Shutdown: cleanup if needed
+    for task in (migration_task, warm_task):
+        if task and not task.done():
+            task.cancel()
+    await app.state.github_client.aclose()
+    await close_db()
+
+
+async def _init_db_in_background():
+    """Run database initialization without failing application startup"""
+    try:
+        await init_db()
+    except Exception:
+        # Already recorded in the migration status
+        pass
 
 
 # Create FastAPI application
@@ -43,10 +75,11 @@ app = FastAPI(
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.CORS_ORIGINS.split(","),
+    allow_origins=settings.CORS_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 
@@ -63,6 +96,12 @@ async def health_check():
     }
 
 
+@app.get("/health/migrations", tags=["Health"])
+async def migration_health():
+    """Startup migration status endpoint"""
+    return get_migration_status()
+
+
 @app.get("/", tags=["Root"])
 async def root():
     """Root endpoint"""
@@ -86,6 +125,7 @@ async def websocket_endpoint(websocket: WebSocket):
     - Client sends: {"action": "subscribe", "submission_id": "xxx"}
     - Client sends: {"action": "unsubscribe", "submission_id": "xxx"}
     - Server sends: {"type": "progress", "submission_id": "xxx", "stage": "...", "progress": 50, "message": "..."}
+    - Bursts of progress messages are coalesced and sent as a JSON array of the above
 
     Example usage:
     ```javascript
@@ -99,7 +139,7 @@ async def websocket_endpoint(websocket: WebSocket):
     };
     ```
     """
-    connection_id = str(uuid.uuid4())
+    connection_id = _uuid4().hex
     ws_manager = get_websocket_manager()
 
     await ws_manager.connect(websocket, connection_id)
@@ -108,7 +148,7 @@ async def websocket_endpoint(websocket: WebSocket):
     try:
         while True:
             # Receive message from client
-            data = await websocket.receive_json()
+            data = orjson.loads(await websocket.receive_text())
             action = data.get("action")
 
             if action == "subscribe":
@@ -3,6 +3,7 @@ SQLAlchemy Models
 """
 
 from app.models.submission import Submission
+from app.models.submission_analysis import SubmissionAnalysis
 from app.models.task import Task
 
-__all__ = ["Submission", "Task"]
+__all__ = ["Submission", "SubmissionAnalysis", "Task"]
@@ -4,26 +4,90 @@ Stores candidate submissions and their scores
 """
 
 import uuid
-from datetime import datetime
-from typing import Optional
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import JSON, DateTime, Float, Integer, String, Text, func
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import DateTime, Float, Index, Integer, String, Text, func, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
+from app.utils.ids import uuid7
+
+if TYPE_CHECKING:
+    from app.models.submission_analysis import SubmissionAnalysis
+
+
+# Column names serialized by to_dict()
+_SUBMISSION_FIELDS = (
+    "id",
+    "candidate_name",
+    "candidate_email",
+    "github_url",
+    "hosted_url",
+    "video_url",
+    "task_id",
+    "status",
+    "error_message",
+    "overall_score",
+    "grade",
+    "recommendation",
+    "scores",
+    "flags",
+    "ai_generation_risk",
+    "strengths",
+    "weaknesses",
+    "screenshots",
+    "processing_time_ms",
+    "created_at",
+    "processed_at",
+)
+
+# Column name -> score report key
+_SCORE_REPORT_FIELDS = {
+    "id": "submissionId",
+    "candidate_name": "candidateName",
+    "candidate_email": "candidateEmail",
+    "github_url": "githubUrl",
+    "hosted_url": "hostedUrl",
+    "overall_score": "overallScore",
+    "grade": "grade",
+    "recommendation": "recommendation",
+    "scores": "scores",
+    "flags": "flags",
+    "ai_generation_risk": "aiGenerationRisk",
+    "strengths": "strengths",
+    "weaknesses": "weaknesses",
+    "screenshots": "screenshots",
+    "processing_time_ms": "processingTimeMs",
+    "processed_at": "analyzedAt",
+}
 
 
 class Submission(Base):
     """Model for storing candidate submissions"""
 
     __tablename__ = "submissions"
+    __table_args__ = (
+        # Partial index for the pending/processing queue
+        Index(
+            "ix_submissions_active",
+            "created_at",
+            postgresql_where=text("status IN ('pending', 'processing')"),
+        ),
+        # Keyset pagination key; a backward scan serves ORDER BY ... DESC
+        Index("ix_submissions_created_at_id", "created_at", "id"),
+        # Status-filtered listing in keyset order; also serves plain status lookups
+        Index("ix_submissions_status_created_at_id", "status", "created_at", "id"),
+        # Bulk upload status: filter by batch and count per status from the index
+        Index("ix_submissions_batch_id_status", "batch_id", "status"),
+    )
 
     # Primary key
-    id: Mapped[str] = mapped_column(
-        UUID(as_uuid=False),
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
         primary_key=True,
-        default=lambda: str(uuid.uuid4()),
+        default=uuid7,
     )
 
     # Candidate info
@@ -36,13 +100,16 @@ class Submission(Base):
     video_url: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
 
     # Task reference
-    task_id: Mapped[Optional[str]] = mapped_column(
-        UUID(as_uuid=False), nullable=True, index=True
+    task_id: Mapped[Optional[uuid.UUID]] = mapped_column(
+        UUID(as_uuid=True), nullable=True, index=True
     )
 
+    # Bulk upload batch this submission was created in
+    batch_id: Mapped[Optional[str]] = mapped_column(String(32), nullable=True)
+
     # Status: pending, processing, completed, failed
     status: Mapped[str] = mapped_column(
-        String(50), nullable=False, default="pending", index=True
+        String(50), nullable=False, default="pending"
     )
     error_message: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
@@ -51,28 +118,43 @@ class Submission(Base):
     grade: Mapped[Optional[str]] = mapped_column(String(5), nullable=True)
     recommendation: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
 
+    # JSON report columns are deferred; load them with undefer_group("report")
     # Detailed scores (JSON)
-    scores: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    scores: Mapped[Optional[dict]] = mapped_column(
+        JSONB, nullable=True, deferred=True, deferred_group="report"
+    )
     # Example: {"fileSeparation": 10, "jqueryAjax": 8, "bootstrap": 10, ...}
 
     # Flags (JSON array)
-    flags: Mapped[Optional[list]] = mapped_column(JSON, nullable=True)
+    flags: Mapped[Optional[list]] = mapped_column(
+        JSONB, nullable=True, deferred=True, deferred_group="report"
+    )
     # Example: ["NO_BOOTSTRAP", "SQL_INJECTION_RISK"]
 
     # AI generation risk score (0.0 - 1.0)
     ai_generation_risk: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
 
     # Strengths and weaknesses (JSON arrays)
-    strengths: Mapped[Optional[list]] = mapped_column(JSON, nullable=True)
-    weaknesses: Mapped[Optional[list]] = mapped_column(JSON, nullable=True)
+    strengths: Mapped[Optional[list]] = mapped_column(
+        JSONB, nullable=True, deferred=True, deferred_group="report"
+    )
+    weaknesses: Mapped[Optional[list]] = mapped_column(
+        JSONB, nullable=True, deferred=True, deferred_group="report"
+    )
 
     # Screenshots (JSON)
-    screenshots: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    screenshots: Mapped[Optional[dict]] = mapped_column(
+        JSONB, nullable=True, deferred=True, deferred_group="report"
+    )
     # Example: {"login": "/screenshots/sub_123_login.png", "register": "...", "profile": "..."}
 
-    # Analysis details (JSON)
-    analysis_details: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
-    # Stores detailed analysis from code analyzer
+    # Analysis details live in submission_analysis; load with selectinload(Submission.analysis)
+    analysis: Mapped[Optional["SubmissionAnalysis"]] = relationship(
+        back_populates="submission",
+        uselist=False,
+        lazy="raise",
+        passive_deletes=True,
+    )
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
@@ -83,7 +165,7 @@ class Submission(Base):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
-        onupdate=func.now(),
+        onupdate=lambda: datetime.now(timezone.utc),  # bound value, no refetch
         nullable=False,
     )
     processed_at: Mapped[Optional[datetime]] = mapped_column(
@@ -100,49 +182,14 @@ class Submission(Base):
         return f"<Submission {self.id} - {self.candidate_email} - {self.status}>"
 
     def to_dict(self) -> dict:
-        """Convert to dictionary for API response"""
-        return {
-            "id": self.id,
-            "candidate_name": self.candidate_name,
-            "candidate_email": self.candidate_email,
-            "github_url": self.github_url,
-            "hosted_url": self.hosted_url,
-            "video_url": self.video_url,
-            "task_id": self.task_id,
-            "status": self.status,
-            "error_message": self.error_message,
-            "overall_score": self.overall_score,
-            "grade": self.grade,
-            "recommendation": self.recommendation,
-            "scores": self.scores,
-            "flags": self.flags,
-            "ai_generation_risk": self.ai_generation_risk,
-            "strengths": self.strengths,
-            "weaknesses": self.weaknesses,
-            "screenshots": self.screenshots,
-            "processing_time_ms": self.processing_time_ms,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "processed_at": self.processed_at.isoformat() if self.processed_at else None,
-        }
+        """Convert to dictionary for API response (UUIDs/datetimes are left for orjson)"""
+        return self._read_fields(_SUBMISSION_FIELDS)
 
     def get_score_report(self) -> dict:
         """Get full score report"""
-        return {
-            "submissionId": self.id,
-            "candidateName": self.candidate_name,
-            "candidateEmail": self.candidate_email,
-            "githubUrl": self.github_url,
-            "hostedUrl": self.hosted_url,
-            "overallScore": self.overall_score,
-            "grade": self.grade,
-            "recommendation": self.recommendation,
-            "scores": self.scores,
-            "flags": self.flags,
-            "aiGenerationRisk": self.ai_generation_risk,
-            "strengths": self.strengths or [],
-            "weaknesses": self.weaknesses or [],
-            "screenshots": self.screenshots,
-            "analysisDetails": self.analysis_details,
-            "processingTimeMs": self.processing_time_ms,
-            "analyzedAt": self.processed_at.isoformat() if self.processed_at else None,
-        }
+        data = self._read_fields(_SCORE_REPORT_FIELDS)
+        report = {key: data[field] for field, key in _SCORE_REPORT_FIELDS.items()}
+        report["submissionId"] = str(report["submissionId"])
+        report["strengths"] = report["strengths"] or []
+        report["weaknesses"] = report["weaknesses"] or []
+        return report
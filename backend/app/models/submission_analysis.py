@@ -0,0 +1,36 @@
+"""
+Submission Analysis Model
+Stores the detailed code-analysis payload for a submission, kept off the main submissions row
+"""
+
+import uuid
+from typing import TYPE_CHECKING, Optional
+
+from sqlalchemy import ForeignKey
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.database import Base
+
+if TYPE_CHECKING:
+    from app.models.submission import Submission
+
+
+class SubmissionAnalysis(Base):
+    """1:1 side table holding analysis details for a submission"""
+
+    __tablename__ = "submission_analysis"
+
+    submission_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("submissions.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    # Detailed analysis from code analyzer (JSON)
+    details: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
+
+    submission: Mapped["Submission"] = relationship(back_populates="analysis", lazy="raise")
+
+    def __repr__(self) -> str:
+        return f"<SubmissionAnalysis {self.submission_id}>"
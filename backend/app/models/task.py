@@ -4,14 +4,29 @@ Stores internship task definitions and scoring criteria
 """
 
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 
-from sqlalchemy import Boolean, DateTime, JSON, String, Text, func
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Boolean, DateTime, String, Text, func
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
+from app.utils.ids import uuid7
+
+
+# Column names serialized by to_dict()
+_TASK_FIELDS = (
+    "id",
+    "title",
+    "description",
+    "expected_structure",
+    "tech_requirements",
+    "scoring_criteria",
+    "is_active",
+    "created_at",
+    "updated_at",
+)
 
 
 class Task(Base):
@@ -20,10 +35,10 @@ class Task(Base):
     __tablename__ = "tasks"
 
     # Primary key
-    id: Mapped[str] = mapped_column(
-        UUID(as_uuid=False),
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
         primary_key=True,
-        default=lambda: str(uuid.uuid4()),
+        default=uuid7,
     )
 
     # Task details
@@ -31,15 +46,15 @@ class Task(Base):
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     # Expected folder structure (JSON)
-    expected_structure: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    expected_structure: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
     # Example: {"folders": ["assets", "css", "js", "php"], "files": ["index.html", "login.html"]}
 
     # Tech stack requirements (JSON)
-    tech_requirements: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    tech_requirements: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
     # Example: {"frontend": ["HTML", "CSS", "JS"], "backend": "PHP", "databases": ["MySQL", "MongoDB", "Redis"]}
 
     # Scoring criteria (JSON) - from SCORING_CRITERIA.md
-    scoring_criteria: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    scoring_criteria: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
     # Example: {"criticalRequirements": 40, "databaseImplementation": 25, ...}
 
     # Task status
@@ -54,7 +69,7 @@ class Task(Base):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
-        onupdate=func.now(),
+        onupdate=lambda: datetime.now(timezone.utc),  # bound value, no refetch
         nullable=False,
     )
 
@@ -62,15 +77,5 @@ class Task(Base):
         return f"<Task {self.id} - {self.title}>"
 
     def to_dict(self) -> dict:
-        """Convert to dictionary for API response"""
-        return {
-            "id": self.id,
-            "title": self.title,
-            "description": self.description,
-            "expected_structure": self.expected_structure,
-            "tech_requirements": self.tech_requirements,
-            "scoring_criteria": self.scoring_criteria,
-            "is_active": self.is_active,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-        }
+        """Convert to dictionary for API response (UUIDs/datetimes are left for orjson)"""
+        return self._read_fields(_TASK_FIELDS)
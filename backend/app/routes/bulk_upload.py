@@ -3,26 +3,43 @@ Bulk Upload API Routes
 Handles template download and bulk submission upload
 """
 
-import io
 import uuid
 import logging
 from datetime import datetime
 
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, status
-from fastapi.responses import StreamingResponse
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import Response
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import func, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import copy_records, get_db
 from app.models.submission import Submission
 from app.services.bulk_upload import bulk_upload_service
 from app.services.queue_service import queue_service
+from app.services.stats_cache import stats_cache
+from app.utils.ids import uuid7
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Batches at least this large are loaded with COPY instead of executemany
+COPY_THRESHOLD = 100
+
+# Column order of the tuples loaded into submissions with COPY
+_UPLOAD_COLUMNS = (
+    "id",
+    "candidate_name",
+    "candidate_email",
+    "github_url",
+    "hosted_url",
+    "video_url",
+    "status",
+    "batch_id",
+)
+
 
 # ===========================================
 # Pydantic Schemas
@@ -74,8 +91,10 @@ async def download_template():
     """
     excel_content = bulk_upload_service.generate_template()
 
-    return StreamingResponse(
-        io.BytesIO(excel_content),
+    # Small, fully built payload: send the bytes as-is rather than re-wrapping
+    # them in a BytesIO for a streaming response
+    return Response(
+        content=excel_content,
         media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
         headers={
             "Content-Disposition": f"attachment; filename=bulk_submission_template_{datetime.now().strftime('%Y%m%d')}.xlsx"
@@ -107,11 +126,12 @@ async def upload_bulk_submissions(
             detail="Invalid file type. Please upload an Excel file (.xlsx or .xls)"
         )
 
-    # Read and parse file
-    content = await file.read()
-
+    # Parse straight from the spooled upload in a worker thread so the
+    # event loop stays free while openpyxl works
     try:
-        submissions, parse_errors = bulk_upload_service.parse_excel(content)
+        submissions, parse_errors = await run_in_threadpool(
+            bulk_upload_service.parse_excel, file.file
+        )
     except Exception as e:
         logger.error(f"Failed to parse Excel file: {e}")
         raise HTTPException(
@@ -128,43 +148,59 @@ async def upload_bulk_submissions(
     # Generate batch ID
     batch_id = f"batch_{uuid.uuid4().hex[:12]}"
 
-    # Create submission records and queue them
+    # Create all submission records in one bulk load; ids are generated
+    # client-side so no RETURNING round-trip is needed
+    rows = [
+        {
+            "id": uuid7(),
+            "candidate_name": sub_data["candidate_name"],
+            "candidate_email": sub_data["candidate_email"],
+            "github_url": sub_data["github_url"],
+            "hosted_url": sub_data.get("hosted_url"),
+            "video_url": sub_data.get("video_url"),
+            "status": "pending",
+            "batch_id": batch_id,
+        }
+        for sub_data in submissions
+    ]
+
+    if len(rows) >= COPY_THRESHOLD:
+        # COPY commits on its own (see copy_records)
+        records = [tuple(row[column] for column in _UPLOAD_COLUMNS) for row in rows]
+        await copy_records(db, Submission.__tablename__, _UPLOAD_COLUMNS, records)
+    else:
+        await db.execute(insert(Submission), rows)
+    await db.commit()  # Commit before workers can pick the jobs up
+    await stats_cache.invalidate()
+
+    # Queue for processing using Redis Queue (one pipelined round-trip). The
+    # redis client is blocking, so keep it off the event loop.
     queued_count = 0
     db_errors = []
 
-    for idx, sub_data in enumerate(submissions):
-        try:
-            # Create submission record
-            submission = Submission(
-                candidate_name=sub_data["candidate_name"],
-                candidate_email=sub_data["candidate_email"],
-                github_url=sub_data["github_url"],
-                hosted_url=sub_data.get("hosted_url"),
-                video_url=sub_data.get("video_url"),
-                status="pending",
-            )
-
-            db.add(submission)
-            await db.flush()  # Get the ID without committing
-
-            # Queue for processing using Redis Queue
-            queue_service.enqueue_submission(
-                str(submission.id),
-                submission.github_url,
-                submission.hosted_url
-            )
-            queued_count += 1
-            logger.info(f"Queued submission {submission.id} from row {idx + 2}")
-
-        except Exception as e:
-            logger.error(f"Failed to create submission {idx + 1}: {e}")
-            db_errors.append({
+    jobs = [(str(row["id"]), row["github_url"], row["hosted_url"]) for row in rows]
+    try:
+        job_ids = await run_in_threadpool(queue_service.enqueue_submissions, jobs)
+        queued_count = len(job_ids)
+    except Exception as e:
+        logger.error(f"Failed to queue batch {batch_id}: {e}")
+        # The rows are already committed; without a job nothing would ever
+        # score them, so fail them visibly (trigger_scoring can retry each)
+        await db.execute(
+            update(Submission)
+            .where(Submission.batch_id == batch_id, Submission.status == "pending")
+            .values(status="failed", error_message=f"Failed to queue for scoring: {e}")
+        )
+        await db.commit()
+        await stats_cache.invalidate()
+        db_errors = [
+            {
                 "row": idx + 2,  # +2 because row 1 is header
                 "error": str(e),
-                "data": sub_data
-            })
-
-    await db.commit()
+                "data": submissions[idx]
+            }
+            for idx in range(len(rows))
+        ]
 
     logger.info(f"Bulk upload complete: batch={batch_id}, queued={queued_count}, errors={len(parse_errors) + len(db_errors)}")
 
@@ -186,22 +222,39 @@ async def get_bulk_status(
     Get status of a bulk upload batch.
 
     Returns counts of completed, failed, and pending submissions.
-    Note: This is a simplified version. For full tracking,
-    add a batch_id column to the submissions table.
     """
-    # Get recent submissions (simplified - in production, filter by batch_id)
+    # Count per status for the batch (served by ix_submissions_batch_id_status)
+    count_result = await db.execute(
+        select(Submission.status, func.count(Submission.id))
+        .where(Submission.batch_id == batch_id)
+        .group_by(Submission.status)
+    )
+    status_counts = dict(count_result.all())
+
+    if not status_counts:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Batch {batch_id} not found",
+        )
+
+    total = sum(status_counts.values())
+    completed = status_counts.get("completed", 0)
+    failed = status_counts.get("failed", 0)
+    pending = status_counts.get("pending", 0) + status_counts.get("processing", 0)
+
+    # Sample of the batch; only the columns the status response needs
     result = await db.execute(
-        select(Submission)
+        select(
+            Submission.id,
+            Submission.candidate_name,
+            Submission.status,
+            Submission.overall_score,
+        )
+        .where(Submission.batch_id == batch_id)
         .order_by(Submission.created_at.desc())
-        .limit(100)
+        .limit(20)
     )
-    submissions = result.scalars().all()
-
-    # Calculate stats
-    total = len(submissions)
-    completed = sum(1 for s in submissions if s.status == "completed")
-    failed = sum(1 for s in submissions if s.status == "failed")
-    pending = sum(1 for s in submissions if s.status in ["pending", "processing"])
+    submissions = result.all()
 
     return BulkStatusResponse(
         batch_id=batch_id,
@@ -217,7 +270,7 @@ async def get_bulk_status(
                 status=s.status,
                 score=s.overall_score
             )
-            for s in submissions[:20]  # Return first 20
+            for s in submissions
         ]
     )
 
@@ -5,22 +5,36 @@ Handles creating submissions and retrieving score reports
 
 import os
 import re
+import hashlib
 import logging
-from datetime import datetime
-from typing import Optional
+from collections import defaultdict
+from datetime import date, datetime
+from email.utils import formatdate
+from functools import lru_cache
+from typing import Any, Optional, Tuple
+from uuid import UUID
 
 import httpx
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
-from fastapi.responses import FileResponse
-from pydantic import BaseModel, EmailStr
-from sqlalchemy import func, select
+import orjson
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse, Response
+from pydantic import BaseModel, ConfigDict, EmailStr
+from sqlalchemy import bindparam, func, insert, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer_group
 
-from app.database import get_db
+from app.database import async_session, get_db
 from app.models.submission import Submission
-from app.workers.scoring_worker import process_submission
+from app.workers.scoring_worker import process_submission_bounded
 from app.config import settings
-from app.services.commit_analyzer import CommitAnalyzer
+from app.services.commit_analyzer import CommitAnalyzer, fetch_commits
+from app.services.github_cache import github_cache
+from app.services.queue_service import queue_service
+from app.services.stats_cache import stats_cache
+from app.utils.pagination import decode_cursor, encode_cursor
+from app.utils.singleflight import SingleFlight
+from app.utils.ttl_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +42,64 @@ router = APIRouter()
 
 # Screenshots directory
 SCREENSHOTS_DIR = getattr(settings, "SCREENSHOTS_DIR", "./screenshots")
+SCREENSHOTS_ACCEL_PREFIX = settings.SCREENSHOTS_ACCEL_PREFIX
+_SCREENSHOT_MEDIA_TYPES = {
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".webp": "image/webp",
+}
+# Re-scoring overwrites screenshots in place, so browsers only keep them an hour
+SCREENSHOT_CACHE_CONTROL = "public, max-age=3600"
+
+# owner/repo from a GitHub URL; whitespace is never part of either
+_GITHUB_URL_RE = re.compile(r'github\.com[/:]([^/\s]+)/([^/.\s]+)')
+
+# Columns returned by the submissions listing, in SubmissionResponse field order
+_SUBMISSION_LIST_COLUMNS = (
+    Submission.id,
+    Submission.candidate_name,
+    Submission.candidate_email,
+    Submission.github_url,
+    Submission.hosted_url,
+    Submission.video_url,
+    Submission.status,
+    Submission.overall_score,
+    Submission.grade,
+    Submission.created_at,
+    Submission.processed_at,
+)
+
+# Hot read statements are built once so SQLAlchemy reuses their compiled
+# form; per-request values go in as bound parameters
+_LIST_SUBMISSIONS_STMT = select(*_SUBMISSION_LIST_COLUMNS).order_by(
+    Submission.created_at.desc(), Submission.id.desc()
+)
+_SUBMISSION_ROW_STMT = select(*_SUBMISSION_LIST_COLUMNS).where(
+    Submission.id == bindparam("submission_id")
+)
+_SCORE_REPORT_STMT = (
+    select(Submission)
+    .options(undefer_group("report"))
+    .where(Submission.id == bindparam("submission_id"))
+)
+
+# All counters and the average come from one scan using FILTER aggregates
+_DASHBOARD_STATS_STMT = select(
+    func.count(Submission.id).label("total_count"),
+    func.avg(Submission.overall_score)
+    .filter(Submission.status == "completed")
+    .label("avg_score"),
+    func.count(Submission.id).filter(Submission.status == "pending").label("pending_count"),
+    func.count(Submission.id)
+    .filter(Submission.status == "processing")
+    .label("processing_count"),
+    func.count(Submission.id).filter(Submission.status == "completed").label("completed_count"),
+    func.count(Submission.id).filter(Submission.status == "failed").label("failed_count"),
+)
+_RECENT_SUBMISSIONS_STMT = (
+    select(*_SUBMISSION_LIST_COLUMNS).order_by(Submission.created_at.desc()).limit(10)
+)
 
 
 # ===========================================
@@ -38,18 +110,22 @@ SCREENSHOTS_DIR = getattr(settings, "SCREENSHOTS_DIR", "./screenshots")
 class SubmissionCreate(BaseModel):
     """Schema for creating a new submission"""
 
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     candidate_name: str
     candidate_email: EmailStr
     github_url: str
     hosted_url: Optional[str] = None
     video_url: Optional[str] = None
-    task_id: Optional[str] = None
+    task_id: Optional[UUID] = None
 
 
 class SubmissionResponse(BaseModel):
     """Schema for submission response"""
 
-    id: str
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
     candidate_name: str
     candidate_email: str
     github_url: str
@@ -61,9 +137,6 @@ class SubmissionResponse(BaseModel):
     created_at: datetime
     processed_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
-
 
 class ScoreReportResponse(BaseModel):
     """Schema for full score report"""
@@ -82,7 +155,7 @@ class ScoreReportResponse(BaseModel):
     strengths: Optional[list] = None
     weaknesses: Optional[list] = None
     screenshots: Optional[dict] = None
-    analyzedAt: Optional[str] = None
+    analyzedAt: Optional[datetime] = None
 
 
 class DashboardStats(BaseModel):
@@ -97,6 +170,111 @@ class DashboardStats(BaseModel):
     recent_submissions: list[SubmissionResponse]
 
 
+async def _dispatch_scoring(
+    background_tasks: BackgroundTasks,
+    submission_id: str,
+    github_url: str,
+    hosted_url: Optional[str],
+):
+    """
+    Hand a submission to the configured scoring backend.
+
+    With SCORING_BACKEND="queue" the job goes to the RQ worker pool so
+    scoring never competes with request handling; if Redis is unreachable
+    it falls back to in-process scoring.
+    """
+    if settings.SCORING_BACKEND == "queue":
+        try:
+            await run_in_threadpool(
+                queue_service.enqueue_submission, submission_id, github_url, hosted_url
+            )
+            return
+        except Exception as e:
+            logger.warning(f"[{submission_id}] Queue unavailable, scoring in-process: {e}")
+
+    background_tasks.add_task(process_submission_bounded, submission_id, github_url, hosted_url)
+
+
+# Coalesces concurrent polls of the same submission into one query
+_reads = SingleFlight()
+
+# submission_id -> (owner, repo) for the commit endpoints
+_github_repos: TTLCache[Tuple[str, str]] = TTLCache(maxsize=4096, ttl=300)
+
+
+async def _load_submission_row(submission_id: UUID) -> Optional[dict]:
+    """Load the response columns for a submission in its own session"""
+    async with async_session() as session:
+        result = await session.execute(
+            _SUBMISSION_ROW_STMT, {"submission_id": submission_id}
+        )
+        row = result.one_or_none()
+        return row._asdict() if row is not None else None
+
+
+async def _load_github_repo(db: AsyncSession, submission_id: UUID) -> Tuple[str, str]:
+    """
+    Resolve a submission's GitHub (owner, repo).
+
+    Raises 404 if the submission is missing and 400 if it has no usable
+    GitHub URL. The URL never changes after creation, so the parsed pair is
+    cached per process and repeat views skip both the database and the regex.
+    """
+    cached = _github_repos.get(submission_id)
+    if cached is not None:
+        return cached
+
+    result = await db.execute(
+        select(Submission.id, Submission.github_url).where(Submission.id == submission_id)
+    )
+    row = result.one_or_none()
+    if row is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Submission {submission_id} not found",
+        )
+
+    if not row.github_url:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No GitHub URL associated with this submission",
+        )
+
+    match = _GITHUB_URL_RE.search(row.github_url)
+    if not match:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid GitHub URL format",
+        )
+
+    owner_repo = (match.group(1), match.group(2))
+    _github_repos.set(submission_id, owner_repo)
+    return owner_repo
+
+
+def _json_response(data: Any, headers: Optional[dict] = None) -> Response:
+    """Encode a hand-built body with orjson, bypassing response_model validation"""
+    return Response(content=orjson.dumps(data), media_type="application/json", headers=headers)
+
+
+def _submission_etag(data: dict) -> str:
+    """Validator for a submission poll; changes whenever scoring advances"""
+    key = f"{data['id']}:{data['status']}:{data['overall_score']}:{data['processed_at']}"
+    return f'"{hashlib.md5(key.encode()).hexdigest()}"'
+
+
+async def _load_score_report(submission_id: UUID) -> Optional[tuple[str, Optional[dict]]]:
+    """Load (status, report) for a submission; report is None until completed"""
+    async with async_session() as session:
+        result = await session.execute(_SCORE_REPORT_STMT, {"submission_id": submission_id})
+        submission = result.scalar_one_or_none()
+        if submission is None:
+            return None
+        if submission.status != "completed":
+            return submission.status, None
+        return submission.status, submission.get_score_report()
+
+
 # ===========================================
 # API Endpoints
 # ===========================================
@@ -115,43 +293,29 @@ async def create_submission(
     Returns submission_id with status "pending".
     Triggers background scoring job.
     """
-    # Create submission record
-    submission = Submission(
-        candidate_name=submission_data.candidate_name,
-        candidate_email=submission_data.candidate_email,
-        github_url=submission_data.github_url,
-        hosted_url=submission_data.hosted_url,
-        video_url=submission_data.video_url,
-        task_id=submission_data.task_id,
-        status="pending",
+    # Create submission record; RETURNING picks up the server-side created_at
+    # so no refresh SELECT is needed
+    result = await db.execute(
+        insert(Submission)
+        .values(
+            candidate_name=submission_data.candidate_name,
+            candidate_email=submission_data.candidate_email,
+            github_url=submission_data.github_url,
+            hosted_url=submission_data.hosted_url,
+            video_url=submission_data.video_url,
+            task_id=submission_data.task_id,
+            status="pending",
+        )
+        .returning(*_SUBMISSION_LIST_COLUMNS)
     )
-
-    db.add(submission)
-    await db.flush()
+    row = result.one()
     await db.commit()  # Commit before background task starts
-    await db.refresh(submission)
+    await stats_cache.invalidate()
 
     # Trigger background scoring job
-    background_tasks.add_task(
-        process_submission,
-        submission.id,
-        submission.github_url,
-        submission.hosted_url,
-    )
+    await _dispatch_scoring(background_tasks, str(row.id), row.github_url, row.hosted_url)
 
-    return SubmissionResponse(
-        id=submission.id,
-        candidate_name=submission.candidate_name,
-        candidate_email=submission.candidate_email,
-        github_url=submission.github_url,
-        hosted_url=submission.hosted_url,
-        video_url=submission.video_url,
-        status=submission.status,
-        overall_score=submission.overall_score,
-        grade=submission.grade,
-        created_at=submission.created_at,
-        processed_at=submission.processed_at,
-    )
+    return SubmissionResponse.model_validate(row)
 
 
 @router.get("/", response_model=list[SubmissionResponse])
@@ -159,41 +323,45 @@ async def list_submissions(
     skip: int = 0,
     limit: int = 20,
     status_filter: Optional[str] = None,
+    cursor: Optional[str] = None,
     db: AsyncSession = Depends(get_db),
 ):
     """
     List all submissions with optional filtering.
 
     Query params:
-    - skip: Number of records to skip (pagination)
+    - skip: Number of records to skip (offset pagination)
     - limit: Maximum records to return
     - status: Filter by status (pending, processing, completed, failed)
+    - cursor: Value of a previous X-Next-Cursor header (keyset pagination; overrides skip)
+
+    Rows are returned as plain dicts straight to orjson; response_model
+    only documents the shape.
     """
-    query = select(Submission).order_by(Submission.created_at.desc())
+    query = _LIST_SUBMISSIONS_STMT
 
     if status_filter:
         query = query.where(Submission.status == status_filter)
 
-    query = query.offset(skip).limit(limit)
-    result = await db.execute(query)
-    submissions = result.scalars().all()
-
-    return [
-        SubmissionResponse(
-            id=s.id,
-            candidate_name=s.candidate_name,
-            candidate_email=s.candidate_email,
-            github_url=s.github_url,
-            hosted_url=s.hosted_url,
-            video_url=s.video_url,
-            status=s.status,
-            overall_score=s.overall_score,
-            grade=s.grade,
-            created_at=s.created_at,
-            processed_at=s.processed_at,
+    if cursor:
+        try:
+            cursor_created_at, cursor_id = decode_cursor(cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        query = query.where(
+            tuple_(Submission.created_at, Submission.id) < (cursor_created_at, cursor_id)
         )
-        for s in submissions
-    ]
+    else:
+        query = query.offset(skip)
+
+    result = await db.execute(query.limit(limit))
+    rows = result.all()
+
+    headers = {}
+    if rows and len(rows) == limit:
+        headers["X-Next-Cursor"] = encode_cursor(rows[-1].created_at, rows[-1].id)
+
+    return _json_response([row._asdict() for row in rows], headers=headers)
 
 
 @router.get("/stats", response_model=DashboardStats)
@@ -203,63 +371,29 @@ async def get_dashboard_stats(
     """
     Get dashboard statistics.
 
-    Returns aggregated counts and recent submissions.
+    Returns aggregated counts and recent submissions. The response dict is
+    built in one pass from the rows and handed straight to orjson;
+    response_model only documents the shape. The encoded body is cached
+    in Redis for a few seconds since the dashboard polls this endpoint.
     """
-    # Total count
-    total_result = await db.execute(select(func.count(Submission.id)))
-    total_count = total_result.scalar() or 0
-
-    # Average score (only from completed submissions)
-    avg_result = await db.execute(
-        select(func.avg(Submission.overall_score)).where(
-            Submission.status == "completed",
-            Submission.overall_score.isnot(None),
-        )
-    )
-    avg_score = avg_result.scalar()
+    cached = await stats_cache.get_dashboard_stats()
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
 
-    # Count by status
-    async def get_status_count(status: str) -> int:
-        result = await db.execute(
-            select(func.count(Submission.id)).where(Submission.status == status)
-        )
-        return result.scalar() or 0
+    # Counts and average score (only from completed submissions) in one query
+    stats = (await db.execute(_DASHBOARD_STATS_STMT)).one()
 
-    pending_count = await get_status_count("pending")
-    processing_count = await get_status_count("processing")
-    completed_count = await get_status_count("completed")
-    failed_count = await get_status_count("failed")
+    # Recent submissions (last 10), listing columns only
+    recent_result = await db.execute(_RECENT_SUBMISSIONS_STMT)
 
-    # Recent submissions (last 10)
-    recent_result = await db.execute(
-        select(Submission).order_by(Submission.created_at.desc()).limit(10)
-    )
-    recent_submissions = recent_result.scalars().all()
-
-    return DashboardStats(
-        total_count=total_count,
-        avg_score=round(avg_score, 1) if avg_score else None,
-        pending_count=pending_count,
-        processing_count=processing_count,
-        completed_count=completed_count,
-        failed_count=failed_count,
-        recent_submissions=[
-            SubmissionResponse(
-                id=s.id,
-                candidate_name=s.candidate_name,
-                candidate_email=s.candidate_email,
-                github_url=s.github_url,
-                hosted_url=s.hosted_url,
-                video_url=s.video_url,
-                status=s.status,
-                overall_score=s.overall_score,
-                grade=s.grade,
-                created_at=s.created_at,
-                processed_at=s.processed_at,
-            )
-            for s in recent_submissions
-        ],
-    )
+    data = stats._asdict()
+    # avg() comes back as Decimal, which orjson does not encode
+    data["avg_score"] = round(float(stats.avg_score), 1) if stats.avg_score else None
+    data["recent_submissions"] = [row._asdict() for row in recent_result]
+
+    body = orjson.dumps(data)
+    await stats_cache.set_dashboard_stats(body)
+    return Response(content=body, media_type="application/json")
 
 
 # ===========================================
@@ -267,7 +401,7 @@ async def get_dashboard_stats(
 # ===========================================
 
 @router.get("/screenshots/{filename}")
-async def get_screenshot(filename: str):
+async def get_screenshot(filename: str, request: Request):
     """
     Serve screenshot files.
 
@@ -275,7 +409,9 @@ async def get_screenshot(filename: str):
         filename: Screenshot filename (e.g., sub_123_index.png)
 
     Returns:
-        Image file response
+        Image file response, or an X-Accel-Redirect hand-off to NGINX
+        when SCREENSHOTS_ACCEL_PREFIX is configured. Served files carry an
+        ETag, and a matching If-None-Match gets a 304 without reading them.
     """
     # Security: prevent path traversal
     if ".." in filename or "/" in filename or "\\" in filename:
@@ -285,68 +421,80 @@ async def get_screenshot(filename: str):
         )
 
     # Only allow image files
-    if not filename.lower().endswith(('.png', '.jpg', '.jpeg', '.webp')):
+    media_type = _SCREENSHOT_MEDIA_TYPES.get(os.path.splitext(filename)[1].lower())
+    if media_type is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid file type"
         )
 
+    headers = {"Cache-Control": SCREENSHOT_CACHE_CONTROL}
+
+    if SCREENSHOTS_ACCEL_PREFIX:
+        # NGINX sends the file itself (and 404s if it is missing); the
+        # worker is released without touching the disk
+        headers["X-Accel-Redirect"] = f"{SCREENSHOTS_ACCEL_PREFIX.rstrip('/')}/{filename}"
+        headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return Response(media_type=media_type, headers=headers)
+
     screenshot_path = os.path.join(SCREENSHOTS_DIR, filename)
 
-    if not os.path.exists(screenshot_path):
+    try:
+        stat_result = os.stat(screenshot_path)
+    except FileNotFoundError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Screenshot not found: {filename}"
         )
 
+    # Re-scoring rewrites the file, which changes mtime and so the ETag
+    headers["ETag"] = f'W/"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
+    headers["Last-Modified"] = formatdate(stat_result.st_mtime, usegmt=True)
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
     return FileResponse(
         screenshot_path,
-        media_type="image/png",
-        filename=filename
+        media_type=media_type,
+        filename=filename,
+        headers=headers,
+        stat_result=stat_result,
     )
 
 
 @router.get("/{submission_id}", response_model=SubmissionResponse)
 async def get_submission(
-    submission_id: str,
-    db: AsyncSession = Depends(get_db),
+    submission_id: UUID,
+    request: Request,
 ):
     """
     Get submission details and status.
 
     Returns submission details including status.
-    If completed, includes score summary.
+    If completed, includes score summary. Responses carry an ETag so
+    pollers sending If-None-Match get a bodyless 304 while nothing changed.
     """
-    result = await db.execute(
-        select(Submission).where(Submission.id == submission_id)
+    # Polled while scoring runs; concurrent polls share one projected query
+    data = await _reads.do(
+        ("submission", submission_id), lambda: _load_submission_row(submission_id)
     )
-    submission = result.scalar_one_or_none()
 
-    if not submission:
+    if data is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Submission {submission_id} not found",
         )
 
-    return SubmissionResponse(
-        id=submission.id,
-        candidate_name=submission.candidate_name,
-        candidate_email=submission.candidate_email,
-        github_url=submission.github_url,
-        hosted_url=submission.hosted_url,
-        video_url=submission.video_url,
-        status=submission.status,
-        overall_score=submission.overall_score,
-        grade=submission.grade,
-        created_at=submission.created_at,
-        processed_at=submission.processed_at,
-    )
+    headers = {"ETag": _submission_etag(data), "Cache-Control": "no-cache"}
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return _json_response(data, headers=headers)
 
 
 @router.get("/{submission_id}/report", response_model=ScoreReportResponse)
 async def get_score_report(
-    submission_id: str,
-    db: AsyncSession = Depends(get_db),
+    submission_id: UUID,
 ):
     """
     Get full score report for a submission.
@@ -354,30 +502,29 @@ async def get_score_report(
     Returns detailed score report with all categories,
     flags, strengths, weaknesses, and screenshots.
     """
-    result = await db.execute(
-        select(Submission).where(Submission.id == submission_id)
+    loaded = await _reads.do(
+        ("report", submission_id), lambda: _load_score_report(submission_id)
     )
-    submission = result.scalar_one_or_none()
 
-    if not submission:
+    if loaded is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Submission {submission_id} not found",
         )
 
-    if submission.status != "completed":
+    submission_status, report = loaded
+    if report is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Submission is not yet completed. Current status: {submission.status}",
+            detail=f"Submission is not yet completed. Current status: {submission_status}",
         )
 
-    report = submission.get_score_report()
     return ScoreReportResponse(**report)
 
 
 @router.post("/{submission_id}/trigger", response_model=SubmissionResponse)
 async def trigger_scoring(
-    submission_id: str,
+    submission_id: UUID,
     background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
 ):
@@ -387,44 +534,28 @@ async def trigger_scoring(
     Useful for retrying failed submissions or
     re-scoring with updated criteria.
     """
+    # Reset status to pending and read back only the response columns
     result = await db.execute(
-        select(Submission).where(Submission.id == submission_id)
+        update(Submission)
+        .where(Submission.id == submission_id)
+        .values(status="pending", error_message=None)
+        .returning(*_SUBMISSION_LIST_COLUMNS)
     )
-    submission = result.scalar_one_or_none()
+    row = result.one_or_none()
 
-    if not submission:
+    if row is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Submission {submission_id} not found",
         )
 
-    # Reset status to pending
-    submission.status = "pending"
-    submission.error_message = None
-    await db.flush()
-    await db.refresh(submission)
+    await db.commit()  # Commit before background task starts
+    await stats_cache.invalidate()
 
     # Trigger background scoring job
-    background_tasks.add_task(
-        process_submission,
-        submission.id,
-        submission.github_url,
-        submission.hosted_url,
-    )
+    await _dispatch_scoring(background_tasks, str(row.id), row.github_url, row.hosted_url)
 
-    return SubmissionResponse(
-        id=submission.id,
-        candidate_name=submission.candidate_name,
-        candidate_email=submission.candidate_email,
-        github_url=submission.github_url,
-        hosted_url=submission.hosted_url,
-        video_url=submission.video_url,
-        status=submission.status,
-        overall_score=submission.overall_score,
-        grade=submission.grade,
-        created_at=submission.created_at,
-        processed_at=submission.processed_at,
-    )
+    return SubmissionResponse.model_validate(row)
 
 
 class CommitItem(BaseModel):
@@ -444,117 +575,121 @@ class CommitHistoryResponse(BaseModel):
     activity: dict
 
 
-@router.get("/{submission_id}/commits", response_model=CommitHistoryResponse)
-async def get_commit_history(
-    submission_id: str,
-    db: AsyncSession = Depends(get_db),
-):
+def _week_key(date_str: str) -> Optional[str]:
     """
-    Get GitHub commit history for a submission's repository.
+    Bucket an ISO-8601 timestamp into a "%Y-%W" week key (Monday-based).
 
-    Returns commit details and activity data for visualization.
+    GitHub dates are always "YYYY-MM-DDTHH:MM:SSZ"; anything without a
+    full date prefix is treated as malformed and skipped.
     """
-    result = await db.execute(
-        select(Submission).where(Submission.id == submission_id)
-    )
-    submission = result.scalar_one_or_none()
+    return _day_week_key(date_str[:10])
 
-    if not submission:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Submission {submission_id} not found",
-        )
 
-    if not submission.github_url:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="No GitHub URL associated with this submission",
-        )
+@lru_cache(maxsize=1024)
+def _day_week_key(day_str: str) -> Optional[str]:
+    """Week key for a "YYYY-MM-DD" day; cached since commits cluster on few days"""
+    if len(day_str) != 10:
+        return None
+    try:
+        day = date(int(day_str[0:4]), int(day_str[5:7]), int(day_str[8:10]))
+    except ValueError:
+        return None
+    yday = day.toordinal() - date(day.year, 1, 1).toordinal()
+    return f"{day.year}-{(yday + 7 - day.weekday()) // 7:02d}"
 
-    # Parse GitHub URL to get owner and repo
-    github_url = submission.github_url
-    match = re.search(r'github\.com[/:]([^/]+)/([^/.]+)', github_url)
-    if not match:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid GitHub URL format",
-        )
 
-    owner = match.group(1)
-    repo = match.group(2)
+async def _fetch_commit_history(
+    client: httpx.AsyncClient, owner: str, repo: str
+) -> tuple[dict, bool]:
+    """
+    Fetch the last 100 commits from GitHub and build the history payload.
 
-    # Prepare headers with optional GitHub token
-    headers = {"Accept": "application/vnd.github.v3+json"}
-    if settings.GITHUB_TOKEN:
-        headers["Authorization"] = f"token {settings.GITHUB_TOKEN}"
+    The payload is built as plain dicts in CommitHistoryResponse's shape
+    and serialized directly, without per-commit model instances.
 
+    Returns:
+        (history, cacheable) - only real answers (200/404) are worth caching,
+        not empty fallbacks for rate limits or GitHub errors
+    """
+    # Get actual commits (last 100), shared with the commit analysis
+    status_code, commits_data = await fetch_commits(client, owner, repo)
+
+    commits = []
+    week_commits = defaultdict(int)
+
+    if status_code == 200:
+        # One pass builds both the commit list and the weekly activity grid
+        for commit in commits_data:
+            commit_info = commit.get("commit", {})
+            author_info = commit_info.get("author", {}) or commit.get("author", {})
+            sha = commit.get("sha", "")
+
+            commits.append({
+                "sha": sha[:7],
+                "message": commit_info.get("message", "").split("\n")[0][:100],  # First line, max 100 chars
+                "author": author_info.get("name", "Unknown") if isinstance(author_info, dict) else "Unknown",
+                "date": author_info.get("date", "") if isinstance(author_info, dict) else "",
+                "url": commit.get("html_url", f"https://github.com/{owner}/{repo}/commit/{sha}"),
+            })
+
+            commit_author = commit_info.get("author", {})
+            date_str = commit_author.get("date", "") if isinstance(commit_author, dict) else ""
+            week_key = _week_key(date_str) if date_str else None
+            if week_key:
+                week_commits[week_key] += 1
+
+    history = {
+        "repo_name": f"{owner}/{repo}",
+        "total_commits": len(commits),
+        "commits": commits,
+        "activity": {
+            "weeks": [
+                {"week": week, "count": count}
+                for week, count in sorted(week_commits.items(), reverse=True)[:52]
+            ]
+        },
+    }
+    # 404 means the repo is missing or private: an empty history is the answer
+    return history, status_code in (200, 404)
+
+
+async def _refresh_commit_history(client: httpx.AsyncClient, owner: str, repo: str):
+    """Re-fetch a stale cached commit history in the background"""
     try:
-        # Fetch commits from GitHub API
-        async with httpx.AsyncClient(timeout=15) as client:
-            # Get actual commits (last 100)
-            commits_response = await client.get(
-                f"https://api.github.com/repos/{owner}/{repo}/commits?per_page=100",
-                headers=headers
-            )
+        history, cacheable = await _fetch_commit_history(client, owner, repo)
+        if cacheable:
+            await github_cache.set_serialized_commits(owner, repo, orjson.dumps(history))
+    except Exception as e:
+        logger.warning(f"Commit history refresh failed for {owner}/{repo}: {e}")
 
-            commits = []
-            activity_data = {"weeks": []}
-
-            if commits_response.status_code == 200:
-                commits_data = commits_response.json()
-
-                for commit in commits_data:
-                    commit_info = commit.get("commit", {})
-                    author_info = commit_info.get("author", {}) or commit.get("author", {})
-
-                    commits.append(CommitItem(
-                        sha=commit.get("sha", "")[:7],
-                        message=commit_info.get("message", "").split("\n")[0][:100],  # First line, max 100 chars
-                        author=author_info.get("name", "Unknown") if isinstance(author_info, dict) else "Unknown",
-                        date=author_info.get("date", "") if isinstance(author_info, dict) else "",
-                        url=commit.get("html_url", f"https://github.com/{owner}/{repo}/commit/{commit.get('sha', '')}")
-                    ))
-
-                # Generate activity grid from commits
-                from collections import defaultdict
-                from datetime import datetime
-
-                week_commits = defaultdict(int)
-                for commit in commits_data:
-                    commit_info = commit.get("commit", {})
-                    author_info = commit_info.get("author", {})
-                    date_str = author_info.get("date", "") if isinstance(author_info, dict) else ""
-                    if date_str:
-                        try:
-                            dt = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-                            week_key = dt.strftime("%Y-%W")
-                            week_commits[week_key] += 1
-                        except:
-                            pass
-
-                activity_data = {
-                    "weeks": [
-                        {"week": week, "count": count}
-                        for week, count in sorted(week_commits.items(), reverse=True)[:52]
-                    ]
-                }
-
-            elif commits_response.status_code == 404:
-                # Repo not found or private
-                return CommitHistoryResponse(
-                    repo_name=f"{owner}/{repo}",
-                    total_commits=0,
-                    commits=[],
-                    activity={"weeks": []}
-                )
-
-            return CommitHistoryResponse(
-                repo_name=f"{owner}/{repo}",
-                total_commits=len(commits),
-                commits=commits,
-                activity=activity_data
-            )
 
+@router.get("/{submission_id}/commits", response_model=CommitHistoryResponse)
+async def get_commit_history(
+    submission_id: UUID,
+    request: Request,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Get GitHub commit history for a submission's repository.
+
+    Returns commit details and activity data for visualization. The
+    serialized body is cached; a stale entry is served as-is while it is
+    refreshed in the background.
+    """
+    owner, repo = await _load_github_repo(db, submission_id)
+
+    # Shared app client: GitHub headers are set on it and connections stay alive
+    client = request.app.state.github_client
+
+    cached, fresh = await github_cache.get_serialized_commits(owner, repo)
+    if cached is not None:
+        if not fresh:
+            background_tasks.add_task(_refresh_commit_history, client, owner, repo)
+        return Response(content=cached, media_type="application/json")
+
+    try:
+        history, cacheable = await _fetch_commit_history(client, owner, repo)
     except httpx.TimeoutException:
         logger.warning(f"GitHub API timeout for {owner}/{repo}")
         return CommitHistoryResponse(
@@ -570,10 +705,17 @@ async def get_commit_history(
             detail=f"Failed to fetch commit history: {str(e)}",
         )
 
+    # Serialize once; cache hits are returned without re-validation
+    body = orjson.dumps(history)
+    if cacheable:
+        await github_cache.set_serialized_commits(owner, repo, body)
+    return Response(content=body, media_type="application/json")
+
 
 @router.get("/{submission_id}/commit-analysis")
 async def get_commit_analysis(
-    submission_id: str,
+    submission_id: UUID,
+    request: Request,
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -585,37 +727,10 @@ async def get_commit_analysis(
     - Timeline analysis
     - Recommendations for interview questions
     """
-    result = await db.execute(
-        select(Submission).where(Submission.id == submission_id)
-    )
-    submission = result.scalar_one_or_none()
-
-    if not submission:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Submission {submission_id} not found",
-        )
-
-    if not submission.github_url:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="No GitHub URL associated with this submission",
-        )
-
-    # Parse GitHub URL
-    github_url = submission.github_url
-    match = re.search(r'github\.com[/:]([^/]+)/([^/.]+)', github_url)
-    if not match:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid GitHub URL format",
-        )
-
-    owner = match.group(1)
-    repo = match.group(2)
+    owner, repo = await _load_github_repo(db, submission_id)
 
     # Run analysis
-    analyzer = CommitAnalyzer()
+    analyzer = CommitAnalyzer(client=request.app.state.github_client)
     analysis = await analyzer.analyze_commits(owner, repo)
 
     return analysis
@@ -5,12 +5,15 @@ With retry logic and circuit breaker for reliability
 """
 
 import os
+import re
 import logging
+from itertools import islice
 from typing import Optional
 
 import anthropic
 
 from app.config import settings
+from app.services.review_cache import review_cache
 from app.utils.resilience import (
     get_circuit_breaker,
     CircuitBreakerOpenError,
@@ -19,6 +22,38 @@ from app.utils.resilience import (
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# AI-style comment phrases, matched in one case-insensitive pass per file
+AI_COMMENT_PATTERNS = (
+    "this function",
+    "this method",
+    "handles the",
+    "responsible for",
+    "parameters:",
+    "returns:",
+    "example:",
+)
+_AI_COMMENT_RE = re.compile("|".join(map(re.escape, AI_COMMENT_PATTERNS)), re.IGNORECASE)
+
+# Code summary ranking: third-party directories are never sent, built or
+# minified files only fill leftover slots, hand-written source goes first
+_SKIPPED_DIRS = ("node_modules", "vendor", "bower_components")
+_LOW_SIGNAL_MARKERS = (".min.", "/dist/", "/build/")
+_SOURCE_EXTENSIONS = (".php", ".js", ".py")
+
+
+def _path_rank(file_path: str) -> int:
+    """Rank a file for the code summary; negative means skip it"""
+    path = file_path.replace("\\", "/").lower()
+    parts = path.split("/")
+    if any(d in parts for d in _SKIPPED_DIRS):
+        return -1
+    if any(m in path for m in _LOW_SIGNAL_MARKERS):
+        return 0
+    if path.endswith(_SOURCE_EXTENSIONS):
+        return 2
+    return 1
+
+
 # Circuit breaker for AI API calls
 ai_circuit = get_circuit_breaker(
     name="anthropic_api",
@@ -115,6 +150,12 @@ Respond in JSON format:
 }}
 """
 
+        # Re-scoring unchanged code yields the same prompt; reuse its review
+        cached = review_cache.get_review(prompt)
+        if cached is not None:
+            logger.info("Using cached AI code review")
+            return cached
+
         # Retry logic with exponential backoff
         max_retries = 3
         base_delay = 1.0
@@ -125,13 +166,7 @@ Respond in JSON format:
             try:
                 logger.info(f"Calling AI API for code review (attempt {attempt + 1}/{max_retries + 1})")
 
-                message = self.client.messages.create(
-                    model="claude-sonnet-4-6-20250514",
-                    max_tokens=1500,
-                    messages=[{"role": "user", "content": prompt}],
-                )
-
-                response_text = message.content[0].text
+                response_text = self._stream_review(prompt)
 
                 # Parse JSON response
                 json_start = response_text.find("{")
@@ -141,6 +176,7 @@ Respond in JSON format:
                     # Record success for circuit breaker (sync version)
                     ai_circuit.record_success_sync()
                     logger.info("AI code review completed successfully")
+                    review_cache.set_review(prompt, result)
                     return result
 
                 logger.warning("Failed to parse AI response as JSON")
@@ -182,6 +218,50 @@ Respond in JSON format:
 
         return self._default_quality_result("AI review failed after all retries")
 
+    def _stream_review(self, prompt: str) -> str:
+        """
+        Stream the review and stop as soon as the JSON object is complete.
+
+        Braces are tracked outside of JSON strings, so trailing prose after
+        the closing brace is never waited for.
+
+        Returns:
+            Response text up to the end of the first top-level JSON object
+            (or the full text if no complete object arrives)
+        """
+        parts = []
+        depth = 0
+        in_string = False
+        escaped = False
+
+        with self.client.messages.stream(
+            model="claude-sonnet-4-6-20250514",
+            max_tokens=1500,
+            messages=[{"role": "user", "content": prompt}],
+        ) as stream:
+            for text in stream.text_stream:
+                for i, ch in enumerate(text):
+                    if in_string:
+                        if escaped:
+                            escaped = False
+                        elif ch == "\\":
+                            escaped = True
+                        elif ch == '"':
+                            in_string = False
+                    elif ch == '"' and depth > 0:
+                        in_string = True
+                    elif ch == "{":
+                        depth += 1
+                    elif ch == "}" and depth > 0:
+                        depth -= 1
+                        if depth == 0:
+                            # Leaving the block closes the stream early
+                            parts.append(text[:i + 1])
+                            return "".join(parts)
+                parts.append(text)
+
+        return "".join(parts)
+
     def detect_ai_generation(
         self,
         repo_info: dict,
@@ -244,16 +324,6 @@ Respond in JSON format:
     def _check_ai_style_comments(self, code_files: dict) -> float:
         """Check for AI-style comments"""
         logger.debug("Checking for AI-style comments")
-        ai_comment_patterns = [
-            "this function",
-            "this method",
-            "handles the",
-            "responsible for",
-            "parameters:",
-            "returns:",
-            "example:",
-        ]
-
         total_files = 0
         ai_style_files = 0
 
@@ -261,9 +331,13 @@ Respond in JSON format:
             if not content:
                 continue
             total_files += 1
-            content_lower = content.lower()
-            matches = sum(1 for p in ai_comment_patterns if p in content_lower)
-            if matches >= 3:
+            # Distinct phrases seen; stop scanning once three have matched
+            matched = set()
+            for match in _AI_COMMENT_RE.finditer(content):
+                matched.add(match.group(0).lower())
+                if len(matched) >= 3:
+                    break
+            if len(matched) >= 3:
                 ai_style_files += 1
                 logger.debug(f"AI-style comments detected in {file_path}")
 
@@ -275,22 +349,34 @@ Respond in JSON format:
         return ratio
 
     def _prepare_code_summary(self, code_files: dict) -> str:
-        """Prepare a summary of code files for AI review"""
+        """Prepare a summary of code files for AI review, most relevant first"""
         summary_parts = []
 
         # Increased limits for better analysis
         max_content_length = 3000  # Increased from 500 to 3000 chars per file
         max_files = 25  # Increased from 10 to 25 files
-
-        for file_path, content in list(code_files.items())[:max_files]:
-            if not content:
-                continue
-
+        max_summary_length = 60000  # Overall cap on the prompt's code section
+
+        ranked = sorted(
+            (
+                (rank, file_path, content)
+                for file_path, content in code_files.items()
+                if content and (rank := _path_rank(file_path)) >= 0
+            ),
+            key=lambda item: -item[0],  # Stable: ties keep discovery order
+        )
+
+        total_length = 0
+        for _, file_path, content in islice(ranked, max_files):
             # Truncate only very long files
             if len(content) > max_content_length:
                 content = content[:max_content_length] + "\n... (truncated)"
 
-            summary_parts.append(f"### {file_path}\n```\n{content}\n```\n")
+            part = f"### {file_path}\n```\n{content}\n```\n"
+            total_length += len(part)
+            if total_length > max_summary_length:
+                break
+            summary_parts.append(part)
 
         return "\n".join(summary_parts)
 
@@ -5,13 +5,17 @@ Handles Excel template generation and parsing for bulk submissions
 
 import io
 import logging
-from typing import List, Dict, Any, Tuple
+import re
+from typing import BinaryIO, List, Dict, Any, Optional, Tuple, Union
 
 from openpyxl import Workbook, load_workbook
 from openpyxl.styles import Font, PatternFill, Border, Side, Alignment
 
 logger = logging.getLogger(__name__)
 
+# Cheap per-row email sanity check, compiled once
+EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
 # Template column definitions matching SubmissionCreate schema
 TEMPLATE_COLUMNS = [
     {"key": "candidate_name", "header": "Candidate Name *", "width": 25, "example": "John Doe"},
@@ -25,13 +29,24 @@ TEMPLATE_COLUMNS = [
 class BulkUploadService:
     """Service for handling bulk submission uploads via Excel"""
 
+    def __init__(self):
+        self._template: Optional[bytes] = None
+
     def generate_template(self) -> bytes:
         """
         Generate Excel template with headers and example row.
 
+        The workbook is static, so it is built once and reused.
+
         Returns:
             bytes: Excel file content
         """
+        if self._template is None:
+            self._template = self._build_template()
+        return self._template
+
+    def _build_template(self) -> bytes:
+        """Build the template workbook"""
         wb = Workbook()
         ws = wb.active
         ws.title = "Bulk Submissions"
@@ -91,36 +106,44 @@ class BulkUploadService:
         # Write to bytes
         buffer = io.BytesIO()
         wb.save(buffer)
-        buffer.seek(0)
         return buffer.getvalue()
 
-    def parse_excel(self, file_content: bytes) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    def parse_excel(
+        self, file_content: Union[bytes, BinaryIO]
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
         """
         Parse uploaded Excel file and return list of submissions.
 
+        Blocking (CPU-bound); call from a worker thread in async code.
+
         Args:
-            file_content: Raw Excel file bytes
+            file_content: Raw Excel file bytes or a seekable binary file
 
         Returns:
             Tuple of (valid_submissions, errors)
         """
+        source = io.BytesIO(file_content) if isinstance(file_content, bytes) else file_content
         try:
-            wb = load_workbook(io.BytesIO(file_content))
+            # Read-only mode streams rows instead of building the full cell graph
+            wb = load_workbook(source, read_only=True, data_only=True)
         except Exception as e:
             logger.error(f"Failed to load Excel file: {e}")
             return [], [{"row": 0, "error": f"Invalid Excel file: {str(e)}", "data": {}}]
 
-        ws = wb.active
+        try:
+            return self._parse_rows(wb.active)
+        finally:
+            wb.close()
+
+    def _parse_rows(self, ws) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Parse data rows of a worksheet into submissions and errors"""
         if ws is None:
             return [], [{"row": 0, "error": "No active sheet found", "data": {}}]
 
+        rows = ws.iter_rows(values_only=True)
+
         # Get headers from first row
-        headers = []
-        for cell in ws[1]:
-            if cell.value:
-                headers.append(str(cell.value).strip())
-            else:
-                headers.append("")
+        headers = [str(value).strip() if value else "" for value in next(rows, ())]
 
         # Map headers to keys using flexible matching
         header_to_key = {}
@@ -131,11 +154,19 @@ class BulkUploadService:
                     header_to_key[col_idx] = col_def["key"]
                     break
 
+        # Resolved once so each row is a positional lookup per mapped column
+        columns = list(header_to_key.items())
+        required = [
+            (col_def["key"], col_def["header"].replace(" *", ""))
+            for col_def in TEMPLATE_COLUMNS
+            if "(optional)" not in col_def["header"]
+        ]
+
         submissions = []
         errors = []
 
-        # Process data rows (skip header row)
-        for row_idx, row in enumerate(ws.iter_rows(min_row=2, values_only=True), 2):
+        # Process data rows (header row already consumed)
+        for row_idx, row in enumerate(rows, 2):
             # Skip empty rows
             if not any(row):
                 continue
@@ -146,17 +177,12 @@ class BulkUploadService:
                 continue
 
             submission = {}
-            for col_idx, value in enumerate(row):
-                if col_idx in header_to_key:
-                    key = header_to_key[col_idx]
-                    submission[key] = str(value).strip() if value else None
+            for col_idx, key in columns:
+                value = row[col_idx] if col_idx < len(row) else None
+                submission[key] = str(value).strip() if value else None
 
             # Validate required fields
-            missing = []
-            for col_def in TEMPLATE_COLUMNS:
-                if "(optional)" not in col_def["header"]:
-                    if not submission.get(col_def["key"]):
-                        missing.append(col_def["header"].replace(" *", ""))
+            missing = [label for key, label in required if not submission.get(key)]
 
             if missing:
                 errors.append({
@@ -167,7 +193,7 @@ class BulkUploadService:
             else:
                 # Validate email format
                 email = submission.get("candidate_email", "")
-                if email and "@" not in email:
+                if email and not EMAIL_RE.match(email):
                     errors.append({
                         "row": row_idx,
                         "error": f"Invalid email format: {email}",
@@ -4,18 +4,174 @@ Analyzes GitHub commit history for AI-generated content detection and patterns
 """
 
 import re
+import asyncio
 import logging
-from typing import Optional
+from importlib.util import find_spec
+from typing import List, Optional, Tuple
 from collections import defaultdict
 from datetime import datetime
 
 import httpx
+import orjson
 
 from app.config import settings
 from app.services.github_cache import github_cache
+from app.utils.resilience import with_retry
+from app.utils.singleflight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
+GITHUB_API_URL = "https://api.github.com"
+
+# HTTP/2 needs the h2 package (httpx[http2]); fall back to HTTP/1.1 without it
+HTTP2_AVAILABLE = find_spec("h2") is not None
+
+
+def create_github_client() -> httpx.AsyncClient:
+    """
+    Create the long-lived GitHub API client.
+
+    The app opens one at startup and shares it across requests so calls
+    reuse keep-alive connections instead of a new TCP+TLS handshake each.
+    With HTTP/2, concurrent GitHub calls also multiplex over one connection.
+    """
+    headers = {"Accept": "application/vnd.github.v3+json"}
+    if settings.GITHUB_TOKEN:
+        headers["Authorization"] = f"token {settings.GITHUB_TOKEN}"
+    return httpx.AsyncClient(
+        base_url=GITHUB_API_URL,
+        headers=headers,
+        timeout=httpx.Timeout(15.0, connect=5.0),
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        http2=HTTP2_AVAILABLE,
+    )
+
+
+# Longest Retry-After we wait out inside a request before giving up
+MAX_RETRY_AFTER = 10
+
+_github_semaphore: Optional[asyncio.Semaphore] = None
+
+# Concurrent cache misses for the same repo share one GitHub fetch
+_commit_fetches = SingleFlight()
+
+
+def _get_github_semaphore() -> asyncio.Semaphore:
+    """
+    Create the GitHub semaphore lazily, inside the running event loop.
+
+    Caps concurrent GitHub calls per process (GITHUB_CONCURRENCY) to stay
+    under GitHub's secondary rate limits.
+    """
+    global _github_semaphore
+    if _github_semaphore is None:
+        _github_semaphore = asyncio.Semaphore(settings.GITHUB_CONCURRENCY)
+    return _github_semaphore
+
+
+@with_retry(
+    max_retries=2,
+    base_delay=1.0,
+    max_delay=8.0,
+    jitter=True,
+    # Fast failures only (e.g. a dropped keep-alive); read timeouts aren't retried
+    retryable_exceptions=(httpx.ConnectError, httpx.ConnectTimeout, httpx.RemoteProtocolError),
+)
+async def _github_get(client: httpx.AsyncClient, url: str, **kwargs) -> httpx.Response:
+    """GET from GitHub under the concurrency cap, retrying transient failures"""
+    async with _get_github_semaphore():
+        return await client.get(url, **kwargs)
+
+
+def _retry_after(response: httpx.Response) -> Optional[int]:
+    """Seconds GitHub asked us to wait on a rate-limited response, if any"""
+    if response.status_code not in (403, 429):
+        return None
+    try:
+        return int(response.headers["Retry-After"])
+    except (KeyError, ValueError):
+        return None
+
+
+async def fetch_commits(
+    client: httpx.AsyncClient,
+    owner: str,
+    repo: str,
+    headers: Optional[dict] = None,
+) -> Tuple[int, List[dict]]:
+    """
+    Fetch the last 100 commits of a repository, shared by every commit view.
+
+    Successful fetches are cached briefly, so the commit history and the
+    commit analysis of the same repo cost one GitHub call between them.
+    Once an entry goes stale it is revalidated with If-None-Match; a 304
+    costs no primary rate-limit budget and reuses the cached payload.
+
+    Args:
+        client: httpx client to call GitHub with
+        owner: Repository owner
+        repo: Repository name
+        headers: Extra request headers (e.g. a non-default token)
+
+    Returns:
+        (HTTP status, commits) - commits is empty unless status is 200;
+        the list may be shared with concurrent callers, so don't mutate it
+    """
+    # Key on the token the request will actually carry, so callers relying
+    # on the client's default headers share a fetch with explicit ones
+    token = (headers or {}).get("Authorization") or client.headers.get("Authorization")
+    return await _commit_fetches.do(
+        ("commits", owner, repo, token),
+        lambda: _load_commits(client, owner, repo, headers),
+    )
+
+
+async def _load_commits(
+    client: httpx.AsyncClient,
+    owner: str,
+    repo: str,
+    headers: Optional[dict],
+) -> Tuple[int, List[dict]]:
+    """Cache lookup plus (conditional) GitHub fetch behind fetch_commits"""
+    cached, etag, fresh = await github_cache.get_raw_commits(owner, repo)
+    if cached is not None and fresh:
+        return 200, orjson.loads(cached)
+
+    request_headers = dict(headers or {})
+    if cached is not None and etag:
+        request_headers["If-None-Match"] = etag
+
+    url = f"{GITHUB_API_URL}/repos/{owner}/{repo}/commits"
+    params = {"per_page": 100}
+    response = await _github_get(client, url, params=params, headers=request_headers)
+
+    # Secondary rate limit: wait it out once if GitHub asks for a short pause
+    delay = _retry_after(response)
+    if delay is not None and delay <= MAX_RETRY_AFTER:
+        logger.warning(f"GitHub asked to retry {owner}/{repo} after {delay}s")
+        await asyncio.sleep(delay)
+        response = await _github_get(client, url, params=params, headers=request_headers)
+
+    if response.status_code == 304 and cached is not None:
+        await github_cache.touch_raw_commits(owner, repo)
+        return 200, orjson.loads(cached)
+
+    remaining = response.headers.get("X-RateLimit-Remaining")
+    if remaining == "0" or response.status_code == 429 or _retry_after(response) is not None:
+        logger.warning(
+            f"GitHub rate limit hit for {owner}/{repo} "
+            f"(reset: {response.headers.get('X-RateLimit-Reset')}, "
+            f"retry-after: {response.headers.get('Retry-After')})"
+        )
+
+    if response.status_code != 200:
+        return response.status_code, []
+
+    await github_cache.set_raw_commits(
+        owner, repo, response.content, response.headers.get("ETag")
+    )
+    return 200, orjson.loads(response.content)
+
 
 class CommitAnalyzer:
     """Service for analyzing commit history for suspicious patterns"""
@@ -42,9 +198,16 @@ class CommitAnalyzer:
         "no_iterations": "No bug fixes or iterations after initial commits",
     }
 
-    def __init__(self, timeout: int = 30, github_token: Optional[str] = None):
+    def __init__(
+        self,
+        timeout: int = 30,
+        github_token: Optional[str] = None,
+        client: Optional[httpx.AsyncClient] = None,
+    ):
         self.timeout = timeout
         self.github_token = github_token or settings.GITHUB_TOKEN
+        # Shared client from the app; a short-lived one is opened otherwise
+        self.client = client
 
     def _get_headers(self) -> dict:
         """Get headers for GitHub API requests"""
@@ -53,11 +216,21 @@ class CommitAnalyzer:
             headers["Authorization"] = f"token {self.github_token}"
         return headers
 
+    async def _fetch_commits(self, owner: str, repo: str) -> Tuple[int, List[dict]]:
+        """Fetch commits through the shared client, or a short-lived one"""
+        if self.client is not None:
+            # The shared client already carries the default token
+            headers = None if self.github_token == settings.GITHUB_TOKEN else self._get_headers()
+            return await fetch_commits(self.client, owner, repo, headers)
+        async with httpx.AsyncClient(timeout=self.timeout) as client:
+            return await fetch_commits(client, owner, repo, self._get_headers())
+
     async def analyze_commits(
         self,
         owner: str,
         repo: str,
-        max_commits: int = 100
+        max_commits: int = 100,
+        commits: Optional[List[dict]] = None,
     ) -> dict:
         """
         Analyze commit history for AI-generated content and patterns.
@@ -65,7 +238,8 @@ class CommitAnalyzer:
         Args:
             owner: GitHub repository owner
             repo: Repository name
-            max_commits: Maximum commits to analyze
+            max_commits: Maximum commits to analyze (at most 100)
+            commits: Already-fetched commits, to skip the GitHub call
 
         Returns:
             dict with analysis results
@@ -87,57 +261,53 @@ class CommitAnalyzer:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            if commits is None:
                 # Fetch commits with details
-                commits_response = await client.get(
-                    f"https://api.github.com/repos/{owner}/{repo}/commits",
-                    params={"per_page": max_commits},
-                    headers=self._get_headers()
-                )
+                status_code, commits = await self._fetch_commits(owner, repo)
 
-                if commits_response.status_code != 200:
+                if status_code != 200:
                     result["findings"].append({
                         "type": "error",
-                        "message": f"Could not fetch commits: HTTP {commits_response.status_code}"
-                    })
-                    return result
-
-                commits = commits_response.json()
-                result["total_commits"] = len(commits)
-
-                if not commits:
-                    result["findings"].append({
-                        "type": "info",
-                        "message": "No commits found in repository"
+                        "message": f"Could not fetch commits: HTTP {status_code}"
                     })
                     return result
 
-                # Analyze commit patterns
-                result["commit_patterns"] = self._analyze_commit_patterns(commits)
-
-                # Analyze timeline
-                result["timeline_analysis"] = self._analyze_timeline(commits)
-
-                # Analyze authors
-                result["author_analysis"] = self._analyze_authors(commits)
-
-                # Calculate AI risk score
-                result["ai_risk_score"] = self._calculate_ai_risk(
-                    commits,
-                    result["commit_patterns"],
-                    result["timeline_analysis"]
-                )
-
-                # Generate findings
-                result["findings"] = self._generate_findings(
-                    commits,
-                    result["commit_patterns"],
-                    result["timeline_analysis"],
-                    result["ai_risk_score"]
-                )
-
-                # Generate recommendations
-                result["recommendations"] = self._generate_recommendations(result)
+            commits = commits[:max_commits]
+            result["total_commits"] = len(commits)
+
+            if not commits:
+                result["findings"].append({
+                    "type": "info",
+                    "message": "No commits found in repository"
+                })
+                return result
+
+            # Analyze commit patterns
+            result["commit_patterns"] = self._analyze_commit_patterns(commits)
+
+            # Analyze timeline
+            result["timeline_analysis"] = self._analyze_timeline(commits)
+
+            # Analyze authors
+            result["author_analysis"] = self._analyze_authors(commits)
+
+            # Calculate AI risk score
+            result["ai_risk_score"] = self._calculate_ai_risk(
+                commits,
+                result["commit_patterns"],
+                result["timeline_analysis"]
+            )
+
+            # Generate findings
+            result["findings"] = self._generate_findings(
+                commits,
+                result["commit_patterns"],
+                result["timeline_analysis"],
+                result["ai_risk_score"]
+            )
+
+            # Generate recommendations
+            result["recommendations"] = self._generate_recommendations(result)
 
         except httpx.TimeoutException:
             result["findings"].append({
@@ -4,8 +4,9 @@ Caches GitHub commit analysis in Redis to avoid API rate limits
 """
 
 import json
+import time
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from datetime import timedelta
 
 import redis.asyncio as redis
@@ -17,6 +18,17 @@ logger = logging.getLogger(__name__)
 # Cache TTL: 24 hours
 CACHE_TTL = timedelta(hours=24)
 
+# Raw GitHub commit lists shared by the history and analysis views: used
+# as-is for 10 minutes, then kept a day longer with their ETag so refreshes
+# can be conditional GETs
+COMMITS_TTL = timedelta(minutes=10)
+COMMITS_VALIDATOR_TTL = timedelta(days=1)
+
+# Commit history bodies: fresh for 10 minutes, then served stale for up to
+# an hour while a background refresh runs
+HISTORY_TTL = timedelta(minutes=10)
+HISTORY_STALE_TTL = timedelta(hours=1)
+
 
 class GitHubCache:
     """Redis-based cache for GitHub commit analysis"""
@@ -38,6 +50,139 @@ class GitHubCache:
         """Generate cache key for a repository"""
         return f"github:commits:{owner}:{repo}"
 
+    async def get_raw_commits(
+        self, owner: str, repo: str
+    ) -> Tuple[Optional[str], Optional[str], bool]:
+        """
+        Get the cached GitHub commits payload if available.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+
+        Returns:
+            (payload, etag, fresh) - payload is None on a miss; when fresh is
+            False the payload should be revalidated with its ETag
+        """
+        try:
+            client = await self._get_client()
+            entry = await client.hgetall(f"github:raw:{owner}:{repo}")
+            if not entry:
+                return None, None, False
+            age = time.time() - float(entry.get("fetched_at", 0))
+            fresh = age < COMMITS_TTL.total_seconds()
+            return entry.get("payload"), entry.get("etag") or None, fresh
+        except Exception as e:
+            logger.warning(f"Cache read error: {e}")
+            return None, None, False
+
+    async def set_raw_commits(
+        self, owner: str, repo: str, payload: bytes, etag: Optional[str] = None
+    ) -> bool:
+        """
+        Cache a GitHub commits payload as returned by the API.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            payload: JSON-encoded commit list
+            etag: GitHub's ETag for the payload, for conditional refreshes
+
+        Returns:
+            True if cached successfully
+        """
+        try:
+            client = await self._get_client()
+            key = f"github:raw:{owner}:{repo}"
+            async with client.pipeline(transaction=True) as pipe:
+                pipe.hset(key, mapping={
+                    "payload": payload,
+                    "etag": etag or "",
+                    "fetched_at": time.time(),
+                })
+                pipe.expire(key, int(COMMITS_VALIDATOR_TTL.total_seconds()))
+                await pipe.execute()
+            return True
+        except Exception as e:
+            logger.warning(f"Cache write error: {e}")
+            return False
+
+    async def touch_raw_commits(self, owner: str, repo: str) -> bool:
+        """
+        Mark a cached commits payload fresh again after GitHub answered 304.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+
+        Returns:
+            True if updated successfully
+        """
+        try:
+            client = await self._get_client()
+            key = f"github:raw:{owner}:{repo}"
+            async with client.pipeline(transaction=True) as pipe:
+                pipe.hset(key, "fetched_at", time.time())
+                pipe.expire(key, int(COMMITS_VALIDATOR_TTL.total_seconds()))
+                await pipe.execute()
+            return True
+        except Exception as e:
+            logger.warning(f"Cache write error: {e}")
+            return False
+
+    def _get_history_keys(self, owner: str, repo: str) -> Tuple[str, str]:
+        """Fresh and stale cache keys for a repository's commit history"""
+        return (
+            f"github:history:{owner}:{repo}",
+            f"github:history:stale:{owner}:{repo}",
+        )
+
+    async def get_serialized_commits(self, owner: str, repo: str) -> Tuple[Optional[str], bool]:
+        """
+        Get the cached commit history body if available.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+
+        Returns:
+            (body, fresh) - body is None on a miss; fresh is False when only
+            the stale copy is left and the caller should refresh it
+        """
+        try:
+            client = await self._get_client()
+            fresh, stale = await client.mget(self._get_history_keys(owner, repo))
+            if fresh is not None:
+                return fresh, True
+            return stale, False
+        except Exception as e:
+            logger.warning(f"Cache read error: {e}")
+            return None, False
+
+    async def set_serialized_commits(self, owner: str, repo: str, body: bytes) -> bool:
+        """
+        Cache a serialized commit history body under the fresh and stale keys.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            body: JSON-encoded response body
+
+        Returns:
+            True if cached successfully
+        """
+        try:
+            client = await self._get_client()
+            fresh_key, stale_key = self._get_history_keys(owner, repo)
+            async with client.pipeline(transaction=False) as pipe:
+                pipe.setex(fresh_key, int(HISTORY_TTL.total_seconds()), body)
+                pipe.setex(stale_key, int(HISTORY_STALE_TTL.total_seconds()), body)
+                await pipe.execute()
+            return True
+        except Exception as e:
+            logger.warning(f"Cache write error: {e}")
+            return False
+
     async def get_commit_analysis(self, owner: str, repo: str) -> Optional[Dict[str, Any]]:
         """
         Get cached commit analysis if available.
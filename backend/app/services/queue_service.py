@@ -4,7 +4,7 @@ Manages background job processing with RQ
 """
 
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, List, Tuple
 
 import redis
 from rq import Queue
@@ -15,6 +15,18 @@ from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Shared RQ options for submission jobs
+JOB_OPTIONS = {
+    "timeout": "10m",     # 10 minute timeout
+    "result_ttl": 3600,   # Keep results for 1 hour
+    "failure_ttl": 86400, # Keep failure info for 24 hours
+}
+
+
+def _job_id(submission_id: str) -> str:
+    """Job ID for a submission (full UUID; uuid7 prefixes are shared within a batch)"""
+    return f"sub_{submission_id}"
+
 
 class QueueService:
     """Service for managing Redis Queue jobs"""
@@ -61,14 +73,41 @@ class QueueService:
             submission_id,
             github_url,
             hosted_url,
-            job_id=f"sub_{submission_id[:8]}",
-            job_timeout="10m",  # 10 minute timeout
-            result_ttl=3600,    # Keep results for 1 hour
-            failure_ttl=86400,  # Keep failure info for 24 hours
+            job_id=_job_id(submission_id),
+            job_timeout=JOB_OPTIONS["timeout"],
+            result_ttl=JOB_OPTIONS["result_ttl"],
+            failure_ttl=JOB_OPTIONS["failure_ttl"],
         )
         logger.info(f"Queued submission {submission_id} as job {job.id}")
         return job.id
 
+    def enqueue_submissions(
+        self,
+        items: Iterable[Tuple[str, str, Optional[str]]],
+    ) -> List[str]:
+        """
+        Queue many submissions in a single Redis pipeline.
+
+        Args:
+            items: (submission_id, github_url, hosted_url) tuples
+
+        Returns:
+            Job IDs in input order
+        """
+        from app.workers.scoring_worker import process_submission_sync
+
+        jobs = self.queue.enqueue_many([
+            Queue.prepare_data(
+                process_submission_sync,
+                args=(submission_id, github_url, hosted_url),
+                job_id=_job_id(submission_id),
+                **JOB_OPTIONS,
+            )
+            for submission_id, github_url, hosted_url in items
+        ])
+        logger.info(f"Queued {len(jobs)} submissions")
+        return [job.id for job in jobs]
+
     def get_job_status(self, job_id: str) -> Optional[Dict[str, Any]]:
         """
         Get status of a queued job.
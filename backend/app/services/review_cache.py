@@ -0,0 +1,90 @@
+"""
+AI Review Cache Service
+Caches AI code review results in Redis, keyed by a hash of the review prompt
+"""
+
+import hashlib
+import logging
+from typing import Optional, Dict, Any
+from datetime import timedelta
+
+import orjson
+import redis
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Cache TTL: 7 days (identical code gets an identical review)
+CACHE_TTL = timedelta(days=7)
+
+
+class ReviewCache:
+    """
+    Redis-based cache for AI code reviews.
+
+    Synchronous on purpose: the reviewer runs inside the scorer's
+    executor thread, not on the event loop.
+    """
+
+    def __init__(self):
+        self._client: Optional[redis.Redis] = None
+
+    def _get_client(self) -> redis.Redis:
+        """Get or create Redis client"""
+        if self._client is None:
+            self._client = redis.from_url(settings.REDIS_URL)
+        return self._client
+
+    def _get_cache_key(self, prompt: str) -> str:
+        """Generate cache key for a review prompt"""
+        return f"ai:review:{hashlib.sha256(prompt.encode()).hexdigest()}"
+
+    def get_review(self, prompt: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached review for an identical prompt if available.
+
+        Args:
+            prompt: Full review prompt (code summary and analysis results)
+
+        Returns:
+            Cached review dict or None if not cached
+        """
+        try:
+            cached = self._get_client().get(self._get_cache_key(prompt))
+            return orjson.loads(cached) if cached else None
+        except Exception as e:
+            logger.warning(f"Review cache read error: {e}")
+            return None
+
+    def set_review(self, prompt: str, review: Dict[str, Any]) -> bool:
+        """
+        Cache a review for 7 days.
+
+        Args:
+            prompt: Full review prompt
+            review: Parsed review result
+
+        Returns:
+            True if cached successfully
+        """
+        try:
+            self._get_client().setex(
+                self._get_cache_key(prompt),
+                int(CACHE_TTL.total_seconds()),
+                orjson.dumps(review),
+            )
+            return True
+        except Exception as e:
+            logger.warning(f"Review cache write error: {e}")
+            return False
+
+    def close(self):
+        """Close Redis connection"""
+        if self._client:
+            self._client.close()
+            self._client = None
+
+
+# Singleton instance
+review_cache = ReviewCache()
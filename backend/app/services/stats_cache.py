@@ -0,0 +1,89 @@
+"""
+Dashboard Stats Cache Service
+Caches the serialized dashboard stats response in Redis for a short TTL
+"""
+
+import logging
+from typing import Optional
+from datetime import timedelta
+
+import redis.asyncio as redis
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Cache TTL: counts may lag by up to this long between invalidations
+CACHE_TTL = timedelta(seconds=30)
+
+CACHE_KEY = "stats:dashboard"
+
+
+class StatsCache:
+    """Redis-based cache for the dashboard stats response body"""
+
+    def __init__(self):
+        self._client: Optional[redis.Redis] = None
+
+    async def _get_client(self) -> redis.Redis:
+        """Get or create Redis client (raw bytes, bodies are stored pre-encoded)"""
+        if self._client is None:
+            self._client = redis.from_url(settings.REDIS_URL)
+        return self._client
+
+    async def get_dashboard_stats(self) -> Optional[bytes]:
+        """
+        Get the cached dashboard stats body if available.
+
+        Returns:
+            JSON-encoded response body or None if not cached
+        """
+        try:
+            client = await self._get_client()
+            return await client.get(CACHE_KEY)
+        except Exception as e:
+            logger.warning(f"Stats cache read error: {e}")
+            return None
+
+    async def set_dashboard_stats(self, body: bytes) -> bool:
+        """
+        Cache the dashboard stats body.
+
+        Args:
+            body: JSON-encoded response body
+
+        Returns:
+            True if cached successfully
+        """
+        try:
+            client = await self._get_client()
+            await client.setex(CACHE_KEY, int(CACHE_TTL.total_seconds()), body)
+            return True
+        except Exception as e:
+            logger.warning(f"Stats cache write error: {e}")
+            return False
+
+    async def invalidate(self) -> bool:
+        """
+        Drop the cached dashboard stats after submissions change.
+
+        Returns:
+            True if invalidated successfully
+        """
+        try:
+            client = await self._get_client()
+            await client.delete(CACHE_KEY)
+            return True
+        except Exception as e:
+            logger.warning(f"Stats cache invalidation error: {e}")
+            return False
+
+    async def close(self):
+        """Close Redis connection"""
+        if self._client:
+            await self._client.close()
+            self._client = None
+
+
+# Singleton instance
+stats_cache = StatsCache()
@@ -5,21 +5,30 @@ Handles real-time communication for progress updates
 
 import logging
 import asyncio
-import json
-from typing import Dict, Set, Optional, Any
+from typing import Dict, List, Set, Optional, Any
 from dataclasses import dataclass, field
 from datetime import datetime
+
+import orjson
 from fastapi import WebSocket
 
 logger = logging.getLogger(__name__)
 
+# Progress events for a connection are coalesced into one frame
+BROADCAST_FLUSH_INTERVAL = 0.01  # seconds
+BROADCAST_MAX_BATCH = 50
+
 
-@dataclass
+@dataclass(slots=True)
 class ConnectionInfo:
     """Information about a WebSocket connection"""
     websocket: WebSocket
     connected_at: datetime = field(default_factory=datetime.utcnow)
     submission_ids: Set[str] = field(default_factory=set)
+    pending: List[Dict[str, Any]] = field(default_factory=list)
+    # Single flusher per connection, so frames are never sent concurrently
+    flush_task: Optional[asyncio.Task] = None
+    flush_now: asyncio.Event = field(default_factory=asyncio.Event)
 
 
 class WebSocketManager:
@@ -60,15 +69,18 @@ class WebSocketManager:
             connection_id: The connection to remove
         """
         async with self._lock:
-            if connection_id in self._connections:
+            conn_info = self._connections.pop(connection_id, None)
+            if conn_info is not None:
+                if conn_info.flush_task is not None:
+                    conn_info.flush_task.cancel()
+                    conn_info.flush_task = None
                 # Remove from all subscriptions
-                for submission_id in self._connections[connection_id].submission_ids:
-                    if submission_id in self._subscriptions:
-                        self._subscriptions[submission_id].discard(connection_id)
-                        if not self._subscriptions[submission_id]:
+                for submission_id in conn_info.submission_ids:
+                    subscribers = self._subscriptions.get(submission_id)
+                    if subscribers is not None:
+                        subscribers.discard(connection_id)
+                        if not subscribers:
                             del self._subscriptions[submission_id]
-
-                del self._connections[connection_id]
         logger.info(f"WebSocket disconnected: {connection_id}")
 
     async def subscribe(self, connection_id: str, submission_id: str):
@@ -80,11 +92,10 @@ class WebSocketManager:
             submission_id: The submission to subscribe to
         """
         async with self._lock:
-            if connection_id in self._connections:
-                self._connections[connection_id].submission_ids.add(submission_id)
-                if submission_id not in self._subscriptions:
-                    self._subscriptions[submission_id] = set()
-                self._subscriptions[submission_id].add(connection_id)
+            conn_info = self._connections.get(connection_id)
+            if conn_info is not None:
+                conn_info.submission_ids.add(submission_id)
+                self._subscriptions.setdefault(submission_id, set()).add(connection_id)
         logger.info(f"Connection {connection_id} subscribed to submission {submission_id}")
 
     async def unsubscribe(self, connection_id: str, submission_id: str):
@@ -96,10 +107,14 @@ class WebSocketManager:
             submission_id: The submission to unsubscribe from
         """
         async with self._lock:
-            if connection_id in self._connections:
-                self._connections[connection_id].submission_ids.discard(submission_id)
-            if submission_id in self._subscriptions:
-                self._subscriptions[submission_id].discard(connection_id)
+            conn_info = self._connections.get(connection_id)
+            if conn_info is not None:
+                conn_info.submission_ids.discard(submission_id)
+            subscribers = self._subscriptions.get(submission_id)
+            if subscribers is not None:
+                subscribers.discard(connection_id)
+                if not subscribers:
+                    del self._subscriptions[submission_id]
         logger.info(f"Connection {connection_id} unsubscribed from submission {submission_id}")
 
     async def broadcast_progress(
@@ -138,20 +153,63 @@ class WebSocketManager:
             logger.debug(f"No subscribers for submission {submission_id}")
             return
 
-        # Send to all subscribers
-        disconnected = []
+        # Queue for all subscribers; bursts go out as a single frame
         for conn_id in subscriber_ids:
-            if conn_id in self._connections:
+            conn_info = self._connections.get(conn_id)
+            if conn_info is not None:
+                self._enqueue(conn_id, conn_info, message_data)
+                logger.debug(f"Queued progress for {conn_id}: {progress}% - {stage}")
+
+    def _enqueue(self, connection_id: str, conn_info: ConnectionInfo, message_data: Dict[str, Any]):
+        """
+        Queue a message for a connection and make sure its flusher is running.
+
+        Args:
+            connection_id: Target connection ID
+            conn_info: The connection's info record
+            message_data: Message to send
+        """
+        conn_info.pending.append(message_data)
+
+        if len(conn_info.pending) >= BROADCAST_MAX_BATCH:
+            # High-water mark reached: don't wait out the coalescing interval
+            conn_info.flush_now.set()
+        if conn_info.flush_task is None:
+            conn_info.flush_task = asyncio.create_task(self._flush(connection_id, conn_info))
+
+    async def _flush(self, connection_id: str, conn_info: ConnectionInfo):
+        """
+        Send queued messages for a connection until its queue is empty.
+
+        Each round waits for the coalescing interval (or the high-water mark),
+        then sends everything queued so far as one frame: a single message as
+        an object, several as an array. Only this task sends progress frames
+        for the connection, so they go out one at a time and in order.
+
+        Args:
+            connection_id: Target connection ID
+            conn_info: The connection's info record
+        """
+        while conn_info.pending:
+            if len(conn_info.pending) < BROADCAST_MAX_BATCH:
                 try:
-                    await self._connections[conn_id].websocket.send_json(message_data)
-                    logger.debug(f"Sent progress to {conn_id}: {progress}% - {stage}")
-                except Exception as e:
-                    logger.warning(f"Failed to send to {conn_id}: {e}")
-                    disconnected.append(conn_id)
+                    await asyncio.wait_for(conn_info.flush_now.wait(), BROADCAST_FLUSH_INTERVAL)
+                except asyncio.TimeoutError:
+                    pass
+            conn_info.flush_now.clear()
 
-        # Clean up disconnected clients
-        for conn_id in disconnected:
-            await self.disconnect(conn_id)
+            pending, conn_info.pending = conn_info.pending, []
+            body = pending[0] if len(pending) == 1 else pending
+            try:
+                await conn_info.websocket.send_text(orjson.dumps(body).decode())
+            except Exception as e:
+                logger.warning(f"Failed to send to {connection_id}: {e}")
+                conn_info.flush_task = None  # disconnect() must not cancel this task
+                await self.disconnect(connection_id)
+                return
+
+        # No await since the loop check, so nothing can be queued in between
+        conn_info.flush_task = None
 
     async def send_to_connection(
         self,
@@ -167,13 +225,14 @@ class WebSocketManager:
             message_type: Type of message
             data: Message data
         """
-        if connection_id in self._connections:
+        conn_info = self._connections.get(connection_id)
+        if conn_info is not None:
             try:
-                await self._connections[connection_id].websocket.send_json({
+                await conn_info.websocket.send_text(orjson.dumps({
                     "type": message_type,
                     "timestamp": datetime.utcnow().isoformat() + "Z",
                     **data
-                })
+                }).decode())
             except Exception as e:
                 logger.warning(f"Failed to send to {connection_id}: {e}")
                 await self.disconnect(connection_id)
@@ -191,12 +250,13 @@ class WebSocketManager:
             "timestamp": datetime.utcnow().isoformat() + "Z",
             **data
         }
+        payload = orjson.dumps(message_data).decode()
 
         disconnected = []
         async with self._lock:
             for conn_id, conn_info in self._connections.items():
                 try:
-                    await conn_info.websocket.send_json(message_data)
+                    await conn_info.websocket.send_text(payload)
                 except Exception as e:
                     logger.warning(f"Failed to send to {conn_id}: {e}")
                     disconnected.append(conn_id)
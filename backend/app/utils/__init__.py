@@ -18,6 +18,10 @@ from app.utils.logging_config import (
     LogContext,
     LogTimer,
 )
+from app.utils.ids import uuid7
+from app.utils.pagination import encode_cursor, decode_cursor
+from app.utils.singleflight import SingleFlight
+from app.utils.ttl_cache import TTLCache
 
 __all__ = [
     # Resilience
@@ -34,4 +38,13 @@ __all__ = [
     "get_logger",
     "LogContext",
     "LogTimer",
+    # IDs
+    "uuid7",
+    # Pagination
+    "encode_cursor",
+    "decode_cursor",
+    # Request coalescing
+    "SingleFlight",
+    # In-process caching
+    "TTLCache",
 ]
@@ -0,0 +1,49 @@
+"""
+Keyset Pagination
+Opaque cursors for (created_at, id) ordered listings
+"""
+
+import base64
+import uuid
+from datetime import datetime
+from typing import Tuple
+
+import orjson
+
+
+def encode_cursor(created_at: datetime, row_id: uuid.UUID) -> str:
+    """
+    Encode the sort key of the last row on a page as an opaque cursor.
+
+    Args:
+        created_at: Creation timestamp of the last row
+        row_id: Primary key of the last row (tiebreaker)
+
+    Returns:
+        str: URL-safe cursor string
+    """
+    payload = orjson.dumps([created_at.isoformat(), str(row_id)])
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    """
+    Decode a cursor produced by encode_cursor().
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = orjson.loads(base64.urlsafe_b64decode(padded))
+        # Cursors are client-supplied: check the shape before converting
+        if (
+            not isinstance(payload, list)
+            or len(payload) != 2
+            or not all(isinstance(value, str) for value in payload)
+        ):
+            raise ValueError("unexpected cursor payload")
+        created_at, row_id = payload
+        return datetime.fromisoformat(created_at), uuid.UUID(row_id)
+    except (ValueError, TypeError, orjson.JSONDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
@@ -6,6 +6,7 @@ Provides retry logic, circuit breaker pattern, and graceful degradation
 import asyncio
 import functools
 import logging
+import random
 import time
 from typing import Callable, Optional, Any, TypeVar, ParamSpec
 from enum import Enum
@@ -124,6 +125,7 @@ def with_retry(
     exponential_backoff: bool = True,
     retryable_exceptions: tuple = (Exception,),
     on_retry: Optional[Callable] = None,
+    jitter: bool = False,
 ):
     """
     Decorator that adds retry logic with exponential backoff.
@@ -135,6 +137,8 @@ def with_retry(
         exponential_backoff: Whether to use exponential backoff
         retryable_exceptions: Tuple of exception types to retry on
         on_retry: Optional callback function called on each retry
+        jitter: Randomize each delay within [delay/2, delay] so callers
+            failing together don't retry in lockstep
 
     Returns:
         Decorated function with retry logic
@@ -161,6 +165,8 @@ def with_retry(
                         delay = min(base_delay * (2 ** attempt), max_delay)
                     else:
                         delay = base_delay
+                    if jitter:
+                        delay = random.uniform(delay / 2, delay)
 
                     logger.warning(
                         f"{func.__name__} failed (attempt {attempt + 1}/{max_retries + 1}), "
@@ -200,6 +206,8 @@ def with_retry(
                         delay = min(base_delay * (2 ** attempt), max_delay)
                     else:
                         delay = base_delay
+                    if jitter:
+                        delay = random.uniform(delay / 2, delay)
 
                     logger.warning(
                         f"{func.__name__} failed (attempt {attempt + 1}/{max_retries + 1}), "
@@ -0,0 +1,44 @@
+"""
+Single-Flight Request Coalescing
+Concurrent callers for the same key share one in-flight coroutine
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar('T')
+
+
+class SingleFlight:
+    """
+    Deduplicates concurrent calls by key.
+
+    The first caller for a key starts the work as a task; callers that
+    arrive while it is running await the same task. Nothing is cached
+    once the task finishes, so results are never staler than one call.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run fn() for key, or join the call already in flight.
+
+        Args:
+            key: Identity of the call (e.g. ("submission", id))
+            fn: Zero-argument coroutine factory doing the work
+
+        Returns:
+            The shared result; exceptions propagate to every caller
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # A cancelled caller must not cancel the work other callers share
+        return await asyncio.shield(task)
+
+    def __len__(self) -> int:
+        return len(self._inflight)
@@ -0,0 +1,54 @@
+"""
+In-Process TTL Cache
+Small bounded mapping whose entries expire after a fixed number of seconds
+"""
+
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, Optional, Tuple, TypeVar
+
+T = TypeVar('T')
+
+
+class TTLCache(Generic[T]):
+    """
+    Per-process cache with a size bound and per-entry expiry.
+
+    Meant for values that rarely or never change, looked up on hot paths.
+    The oldest entry is evicted once maxsize is reached. Not shared between
+    workers, so only cache what is safe to be briefly stale.
+    """
+
+    def __init__(self, maxsize: int = 4096, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, T]]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[T]:
+        """Return the cached value, or None if missing or expired"""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        return value
+
+    def set(self, key: Hashable, value: T) -> None:
+        """Store a value, evicting the oldest entry when full"""
+        self._data.pop(key, None)
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        """Drop a key if present"""
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every entry"""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -2,6 +2,10 @@
 Background Job Workers
 """
 
-from app.workers.scoring_worker import process_submission, queue_submission
+from app.workers.scoring_worker import (
+    process_submission,
+    process_submission_bounded,
+    queue_submission,
+)
 
-__all__ = ["process_submission", "queue_submission"]
+__all__ = ["process_submission", "process_submission_bounded", "queue_submission"]
@@ -6,20 +6,45 @@ With WebSocket progress updates
 
 import asyncio
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 
+try:
+    import uvloop  # Installed with uvicorn[standard]; not available on Windows
+except ImportError:
+    uvloop = None
+
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
 from app.database import async_session
 from app.models.submission import Submission
+from app.models.submission_analysis import SubmissionAnalysis
 from app.services.scorer import Scorer
 from app.services.websocket_manager import get_websocket_manager
 
 logger = logging.getLogger(__name__)
 
+# Caps in-process scoring jobs; created lazily on the API event loop
+_scoring_semaphore: Optional[asyncio.Semaphore] = None
+
+
+def _get_scoring_semaphore() -> asyncio.Semaphore:
+    """Get or create the in-process scoring semaphore"""
+    global _scoring_semaphore
+    if _scoring_semaphore is None:
+        _scoring_semaphore = asyncio.Semaphore(settings.SCORING_CONCURRENCY)
+    return _scoring_semaphore
+
+
+def _run(coro):
+    """Run a coroutine to completion, on uvloop when it is installed"""
+    loop_factory = uvloop.new_event_loop if uvloop is not None else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        return runner.run(coro)
+
 
 async def process_submission(
     submission_id: str,
@@ -41,8 +66,8 @@ async def process_submission(
 
     async with async_session() as db:
         try:
-            # Update status to processing
-            await update_submission_status(db, submission_id, "processing")
+            # Update status to processing; keep the row for the later updates
+            submission = await update_submission_status(db, submission_id, "processing")
 
             # Broadcast initial status via WebSocket
             await ws_manager.broadcast_progress(
@@ -82,7 +107,7 @@ async def process_submission(
             )
 
             # Update submission with results
-            await update_submission_results(db, submission_id, result)
+            await update_submission_results(db, submission_id, result, submission=submission)
 
             # Broadcast completion via WebSocket
             await ws_manager.broadcast_progress(
@@ -118,18 +143,46 @@ async def process_submission(
             )
 
 
+async def process_submission_bounded(
+    submission_id: str,
+    github_url: str,
+    hosted_url: Optional[str] = None,
+):
+    """
+    Process a submission in the API process, limited to
+    SCORING_CONCURRENCY jobs at a time.
+
+    Used for BackgroundTasks dispatch; RQ workers call
+    process_submission directly (one job per worker).
+    """
+    async with _get_scoring_semaphore():
+        await process_submission(submission_id, github_url, hosted_url)
+
+
+async def load_submission(db: AsyncSession, submission_id: str) -> Optional[Submission]:
+    """Load a submission by ID"""
+    result = await db.execute(
+        select(Submission).where(Submission.id == submission_id)
+    )
+    return result.scalar_one_or_none()
+
+
 async def update_submission_status(
     db: AsyncSession,
     submission_id: str,
     status: str,
     error_message: Optional[str] = None,
-):
-    """Update submission status in database"""
+    submission: Optional[Submission] = None,
+) -> Optional[Submission]:
+    """
+    Update submission status in database.
+
+    Pass an already-loaded submission to skip the SELECT.
+    Returns the updated submission, or None if it doesn't exist.
+    """
     logger.info(f"[{submission_id}] Updating status to: {status}")
-    result = await db.execute(
-        select(Submission).where(Submission.id == submission_id)
-    )
-    submission = result.scalar_one_or_none()
+    if submission is None:
+        submission = await load_submission(db, submission_id)
 
     if submission:
         submission.status = status
@@ -139,19 +192,23 @@ async def update_submission_status(
         await db.commit()
     else:
         logger.warning(f"[{submission_id}] Submission not found in database")
+    return submission
 
 
 async def update_submission_results(
     db: AsyncSession,
     submission_id: str,
     result: dict,
+    submission: Optional[Submission] = None,
 ):
-    """Update submission with scoring results"""
+    """
+    Update submission with scoring results.
+
+    Pass an already-loaded submission to skip the SELECT.
+    """
     logger.info(f"[{submission_id}] Updating with results: score={result.get('overall_score')}, grade={result.get('grade')}")
-    result_db = await db.execute(
-        select(Submission).where(Submission.id == submission_id)
-    )
-    submission = result_db.scalar_one_or_none()
+    if submission is None:
+        submission = await load_submission(db, submission_id)
 
     if submission:
         submission.status = result.get("status", "completed")
@@ -166,9 +223,19 @@ async def update_submission_results(
         submission.strengths = result.get("strengths", [])
         submission.weaknesses = result.get("weaknesses", [])
         submission.screenshots = result.get("screenshots", {})
-        submission.analysis_details = result.get("analysis_details", {})
         submission.processing_time_ms = result.get("processing_time_ms")
-        submission.processed_at = datetime.utcnow()
+        submission.processed_at = datetime.now(timezone.utc)
+
+        # Analysis details are stored in their own table; upsert so re-scoring overwrites
+        details = result.get("analysis_details", {})
+        await db.execute(
+            insert(SubmissionAnalysis)
+            .values(submission_id=submission.id, details=details)
+            .on_conflict_do_update(
+                index_elements=[SubmissionAnalysis.submission_id],
+                set_={"details": details},
+            )
+        )
         await db.commit()
         logger.info(f"[{submission_id}] Results saved to database")
     else:
@@ -188,7 +255,7 @@ def queue_submission(submission_id: str, github_url: str, hosted_url: Optional[s
         hosted_url: Optional hosted deployment URL
     """
     # For synchronous processing (development)
-    asyncio.create_task(process_submission(submission_id, github_url, hosted_url))
+    asyncio.create_task(process_submission_bounded(submission_id, github_url, hosted_url))
 
 
 def process_submission_sync(
@@ -207,7 +274,7 @@ def process_submission_sync(
         github_url: GitHub repository URL
         hosted_url: Optional hosted deployment URL
     """
-    asyncio.run(process_submission(submission_id, github_url, hosted_url))
+    _run(process_submission(submission_id, github_url, hosted_url))
 
 
 # For running worker standalone
@@ -222,4 +289,4 @@ if __name__ == "__main__":
     github_url = sys.argv[2]
     hosted_url = sys.argv[3] if len(sys.argv) > 3 else None
 
-    asyncio.run(process_submission(submission_id, github_url, hosted_url))
+    _run(process_submission(submission_id, github_url, hosted_url))
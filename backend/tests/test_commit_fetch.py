@@ -0,0 +1,50 @@
+"""
+Shared GitHub Commit Fetch Tests
+"""
+
+import asyncio
+
+import httpx
+
+from app.config import settings
+from app.services import commit_analyzer
+from app.services.commit_analyzer import CommitAnalyzer, fetch_commits
+
+
+class _NoCache:
+    """github_cache stand-in that always misses"""
+
+    async def get_raw_commits(self, owner, repo):
+        return None, None, False
+
+    async def set_raw_commits(self, owner, repo, payload, etag=None):
+        return True
+
+    async def touch_raw_commits(self, owner, repo):
+        return True
+
+
+async def test_history_and_analyzer_share_one_fetch(monkeypatch):
+    monkeypatch.setattr(commit_analyzer, "github_cache", _NoCache())
+    calls = 0
+
+    async def handler(request):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json=[{"sha": "abc"}])
+
+    headers = {}
+    if settings.GITHUB_TOKEN:
+        headers["Authorization"] = f"token {settings.GITHUB_TOKEN}"
+    async with httpx.AsyncClient(
+        transport=httpx.MockTransport(handler), headers=headers
+    ) as client:
+        analyzer = CommitAnalyzer(client=client)
+        history, analyzed = await asyncio.gather(
+            fetch_commits(client, "owner", "repo"),
+            analyzer._fetch_commits("owner", "repo"),
+        )
+
+    assert calls == 1
+    assert history == analyzed == (200, [{"sha": "abc"}])
@@ -0,0 +1,60 @@
+"""
+Keyset Pagination Tests
+"""
+
+import base64
+import uuid
+from datetime import datetime, timezone
+
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+
+from app.database import get_db
+from app.main import app
+from app.utils.pagination import decode_cursor, encode_cursor
+
+
+def _raw_cursor(payload) -> str:
+    """Base64-encode an arbitrary JSON payload the way encode_cursor does"""
+    return base64.urlsafe_b64encode(orjson.dumps(payload)).decode().rstrip("=")
+
+
+MALFORMED_CURSORS = [
+    "not-base64!!",
+    base64.urlsafe_b64encode(b"not json").decode(),
+    _raw_cursor({"created_at": "2024-01-01"}),
+    _raw_cursor(["2024-01-01"]),
+    _raw_cursor(["2024-01-01", 5]),
+    _raw_cursor([5, str(uuid.uuid4())]),
+    _raw_cursor(["not a date", str(uuid.uuid4())]),
+    _raw_cursor(["2024-01-01", "not a uuid"]),
+    _raw_cursor(["2024-01-01", str(uuid.uuid4()), "extra"]),
+]
+
+
+def test_cursor_round_trip():
+    created_at = datetime(2024, 1, 1, 12, 30, tzinfo=timezone.utc)
+    row_id = uuid.uuid4()
+
+    assert decode_cursor(encode_cursor(created_at, row_id)) == (created_at, row_id)
+
+
+@pytest.mark.parametrize("cursor", MALFORMED_CURSORS)
+def test_decode_cursor_rejects_malformed(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+
+@pytest.mark.parametrize("cursor", MALFORMED_CURSORS)
+def test_list_submissions_malformed_cursor_is_400(cursor):
+    async def no_db():
+        yield None  # The cursor is rejected before any query runs
+
+    app.dependency_overrides[get_db] = no_db
+    try:
+        response = TestClient(app).get("/api/submissions/", params={"cursor": cursor})
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+
+    assert response.status_code == 400
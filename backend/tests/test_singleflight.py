@@ -0,0 +1,108 @@
+"""
+Single-Flight Request Coalescing Tests
+"""
+
+import asyncio
+
+import pytest
+
+from app.utils.singleflight import SingleFlight
+
+
+async def test_concurrent_callers_share_one_call():
+    flight = SingleFlight()
+    calls = 0
+
+    async def work():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "result"
+
+    results = await asyncio.gather(*(flight.do("key", work) for _ in range(10)))
+
+    assert results == ["result"] * 10
+    assert calls == 1
+
+
+async def test_different_keys_run_separately():
+    flight = SingleFlight()
+    calls = []
+
+    async def work(key):
+        calls.append(key)
+        await asyncio.sleep(0.01)
+        return key
+
+    results = await asyncio.gather(
+        flight.do("a", lambda: work("a")),
+        flight.do("b", lambda: work("b")),
+    )
+
+    assert results == ["a", "b"]
+    assert sorted(calls) == ["a", "b"]
+
+
+async def test_exception_reaches_every_waiter():
+    flight = SingleFlight()
+
+    async def work():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+    results = await asyncio.gather(
+        *(flight.do("key", work) for _ in range(3)), return_exceptions=True
+    )
+
+    assert len(results) == 3
+    assert all(isinstance(r, RuntimeError) and str(r) == "boom" for r in results)
+
+
+async def test_cancelling_one_waiter_keeps_shared_task_running():
+    flight = SingleFlight()
+    release = asyncio.Event()
+
+    async def work():
+        await release.wait()
+        return "done"
+
+    first = asyncio.ensure_future(flight.do("key", work))
+    second = asyncio.ensure_future(flight.do("key", work))
+    await asyncio.sleep(0)
+
+    first.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+    release.set()
+    assert await second == "done"
+
+
+async def test_key_is_cleared_after_completion():
+    flight = SingleFlight()
+    calls = 0
+
+    async def work():
+        nonlocal calls
+        calls += 1
+        return calls
+
+    assert await flight.do("key", work) == 1
+    await asyncio.sleep(0)  # Let the done-callback run
+    assert len(flight) == 0
+
+    # Nothing is cached: the next call runs the work again
+    assert await flight.do("key", work) == 2
+
+
+async def test_key_is_cleared_after_failure():
+    flight = SingleFlight()
+
+    async def work():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        await flight.do("key", work)
+    await asyncio.sleep(0)
+
+    assert len(flight) == 0
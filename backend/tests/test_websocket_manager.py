@@ -0,0 +1,115 @@
+"""
+WebSocket Manager Tests
+"""
+
+import asyncio
+
+import orjson
+
+from app.services import websocket_manager
+from app.services.websocket_manager import BROADCAST_MAX_BATCH, WebSocketManager
+
+
+class FakeWebSocket:
+    """Records frames; each send yields so sends can overlap if unserialized"""
+
+    def __init__(self, send_delay: float = 0.0):
+        self.frames = []
+        self.send_delay = send_delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, text: str):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.send_delay)
+            self.frames.append(orjson.loads(text))
+        finally:
+            self.in_flight -= 1
+
+
+async def _subscribed_manager(websocket: FakeWebSocket) -> WebSocketManager:
+    manager = WebSocketManager()
+    await manager.connect(websocket, "conn")
+    await manager.subscribe("conn", "sub")
+    return manager
+
+
+async def _drain(manager: WebSocketManager):
+    """Wait until the connection's flusher has sent everything"""
+    conn_info = manager._connections["conn"]
+    while conn_info.flush_task is not None:
+        await asyncio.sleep(0.005)
+
+
+def _progress_values(frames) -> list:
+    messages = []
+    for frame in frames:
+        messages.extend(frame if isinstance(frame, list) else [frame])
+    return [message["progress"] for message in messages]
+
+
+async def test_single_message_is_sent_as_object():
+    websocket = FakeWebSocket()
+    manager = await _subscribed_manager(websocket)
+
+    await manager.broadcast_progress("sub", "cloning", 10)
+    await _drain(manager)
+
+    assert len(websocket.frames) == 1
+    assert isinstance(websocket.frames[0], dict)
+    assert websocket.frames[0]["progress"] == 10
+
+
+async def test_burst_is_sent_as_one_array_frame():
+    websocket = FakeWebSocket()
+    manager = await _subscribed_manager(websocket)
+
+    for progress in (10, 20, 30):
+        await manager.broadcast_progress("sub", "analyzing", progress)
+    await _drain(manager)
+
+    assert len(websocket.frames) == 1
+    assert isinstance(websocket.frames[0], list)
+    assert _progress_values(websocket.frames) == [10, 20, 30]
+
+
+async def test_high_water_flushes_are_serialized_and_ordered(monkeypatch):
+    # A long interval means only the high-water mark triggers early flushes
+    monkeypatch.setattr(websocket_manager, "BROADCAST_FLUSH_INTERVAL", 0.05)
+    websocket = FakeWebSocket(send_delay=0.01)
+    manager = await _subscribed_manager(websocket)
+
+    total = BROADCAST_MAX_BATCH * 3 + 7
+    for progress in range(total):
+        await manager.broadcast_progress("sub", "scoring", progress)
+        if progress % 20 == 0:
+            await asyncio.sleep(0.004)  # Let sends start while more arrive
+    await _drain(manager)
+
+    assert _progress_values(websocket.frames) == list(range(total))
+    assert websocket.max_in_flight == 1
+    assert len(websocket.frames) > 1
+
+
+async def test_failed_send_disconnects():
+    websocket = FakeWebSocket()
+
+    async def broken_send(text):
+        raise RuntimeError("closed")
+
+    websocket.send_text = broken_send
+    manager = await _subscribed_manager(websocket)
+
+    await manager.broadcast_progress("sub", "cloning", 10)
+    for _ in range(20):
+        if manager.connection_count == 0:
+            break
+        await asyncio.sleep(0.005)
+
+    assert manager.connection_count == 0
+    assert manager.get_stats()["total_subscriptions"] == 0
@@ -0,0 +1,30 @@
+"""
+Commit History Week Bucketing Tests
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.routes.submissions import _day_week_key, _week_key
+
+
+def test_matches_strftime_across_year_boundaries():
+    day = datetime(2019, 12, 20, 13, 45, 7)
+    for _ in range(800):
+        assert _week_key(day.strftime("%Y-%m-%dT%H:%M:%SZ")) == day.strftime("%Y-%W")
+        day += timedelta(days=3)
+
+
+def test_cache_is_keyed_on_the_day():
+    _day_week_key.cache_clear()
+    _week_key("2024-03-05T01:00:00Z")
+    _week_key("2024-03-05T22:59:59Z")
+
+    info = _day_week_key.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
+@pytest.mark.parametrize("date_str", ["2024", "2024-03", "2024-13-01T00:00:00Z", "not-a-date!"])
+def test_malformed_dates_are_skipped(date_str):
+    assert _week_key(date_str) is None
@@ -48,32 +48,10 @@ class WebSocketManager {
 
     this.ws.onmessage = (event) => {
       try {
-        const data = JSON.parse(event.data);
-        console.log('[WebSocket] Received:', data.type, data);
-
-        // Handle progress updates
-        if (data.type === 'progress' && data.submission_id) {
-          const callbacks = this.subscribers.get(data.submission_id);
-          if (callbacks) {
-            callbacks.forEach((cb) => cb(data));
-          }
-        }
-
-        // Handle completion
-        if (data.type === 'progress' && data.stage === 'completed') {
-          const callbacks = this.subscribers.get(data.submission_id);
-          if (callbacks) {
-            callbacks.forEach((cb) => cb({ ...data, done: true }));
-          }
-        }
-
-        // Handle errors
-        if (data.type === 'progress' && data.stage === 'failed') {
-          const callbacks = this.subscribers.get(data.submission_id);
-          if (callbacks) {
-            callbacks.forEach((cb) => cb({ ...data, error: true }));
-          }
-        }
+        const parsed = JSON.parse(event.data);
+        // Bursts of progress updates arrive batched as an array
+        const messages = Array.isArray(parsed) ? parsed : [parsed];
+        messages.forEach((data) => this.handleMessage(data));
       } catch (err) {
         console.error('[WebSocket] Parse error:', err);
       }
@@ -89,6 +67,38 @@ class WebSocketManager {
     };
   }
 
+  /**
+   * Dispatch a single server message to subscribers
+   * @param {object} data - Parsed message
+   */
+  handleMessage(data) {
+    console.log('[WebSocket] Received:', data.type, data);
+
+    // Handle progress updates
+    if (data.type === 'progress' && data.submission_id) {
+      const callbacks = this.subscribers.get(data.submission_id);
+      if (callbacks) {
+        callbacks.forEach((cb) => cb(data));
+      }
+    }
+
+    // Handle completion
+    if (data.type === 'progress' && data.stage === 'completed') {
+      const callbacks = this.subscribers.get(data.submission_id);
+      if (callbacks) {
+        callbacks.forEach((cb) => cb({ ...data, done: true }));
+      }
+    }
+
+    // Handle errors
+    if (data.type === 'progress' && data.stage === 'failed') {
+      const callbacks = this.subscribers.get(data.submission_id);
+      if (callbacks) {
+        callbacks.forEach((cb) => cb({ ...data, error: true }));
+      }
+    }
+  }
+
   /**
    * Attempt to reconnect
    */